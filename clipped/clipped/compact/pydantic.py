@@ -1,8 +1,21 @@
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, TypeVar
+import functools
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from clipped.utils.json import orjson_dumps, orjson_loads
 
 T = TypeVar("T")
+TYPE_ADAPTER_CACHE_SIZE = 2048
 from pydantic.version import VERSION as PYDANTIC_VERSION
 
 if PYDANTIC_VERSION.startswith("2."):
@@ -41,8 +54,10 @@ if PYDANTIC_VERSION.startswith("2."):
         model_validator,
         validate_call,
     )
+    from pydantic import TypeAdapter
     from pydantic.deprecated.parse import Protocol, load_str_bytes
     from pydantic.deprecated.tools import NameFactory
+    from pydantic.functional_serializers import PlainSerializer, WrapSerializer
     from pydantic.v1.datetime_parse import parse_date, parse_datetime, parse_duration
     from pydantic.v1.validators import strict_str_validator, uuid_validator
 
@@ -50,6 +65,8 @@ if PYDANTIC_VERSION.startswith("2."):
     validation_after = {"mode": "after"}
     validation_always = {}
 
+    SERIALIZER_TYPES: Tuple[Type, ...] = (PlainSerializer, WrapSerializer)
+
     NAME_REGEX = r"^[-a-zA-Z0-9_]+\z"
     FULLY_QUALIFIED_NAME_REGEX = r"^[-a-zA-Z0-9_]+(:[-a-zA-Z0-9_.]+)?\z"
 
@@ -80,11 +97,26 @@ if PYDANTIC_VERSION.startswith("2."):
     class PydanticValueError(ValueError):
         pass
 
+    @functools.lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+    def _get_cached_type_adapter(type_: Type[T]) -> "TypeAdapter[T]":
+        return TypeAdapter(type_)
+
+    def get_type_adapter(type_: Type[T]) -> "TypeAdapter[T]":
+        try:
+            hash(type_)
+        except TypeError:
+            # Unhashable types (e.g. annotated with unhashable metadata)
+            return TypeAdapter(type_)
+        return _get_cached_type_adapter(type_)  # type: ignore[arg-type]
+
     def parse_obj_as(type_: Type[T], obj: Any, **type_forwarding) -> T:
-        from pydantic import TypeAdapter
+        return get_type_adapter(type_).validate_python(obj)
+
+    def parse_obj_as_cache_info() -> functools._CacheInfo:
+        return _get_cached_type_adapter.cache_info()
 
-        adapter = TypeAdapter(type_)
-        return adapter.validate_python(obj)
+    def parse_obj_as_cache_clear() -> None:
+        _get_cached_type_adapter.cache_clear()
 
     class BaseModel(_BaseModel):
         def __init__(self, **data):
@@ -155,6 +187,8 @@ else:
     validation_after = {"pre": False}
     validation_always = {"always": True}
 
+    SERIALIZER_TYPES = ()
+
     NAME_REGEX = r"^[-a-zA-Z0-9_]+\Z"
     FULLY_QUALIFIED_NAME_REGEX = r"^[-a-zA-Z0-9_]+(:[-a-zA-Z0-9_.]+)?\Z"
 
@@ -168,6 +202,13 @@ else:
         model_type.update_forward_refs(**type_forwarding)
         return model_type(__root__=obj).__root__
 
+    def parse_obj_as_cache_info() -> functools._CacheInfo:
+        # Parsing models are already cached by pydantic
+        return _get_parsing_type.cache_info()
+
+    def parse_obj_as_cache_clear() -> None:
+        _get_parsing_type.cache_clear()
+
     class PydanticConfig:
         allow_population_by_field_name = True
         validate_assignment = True
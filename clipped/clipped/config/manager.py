@@ -1,6 +1,5 @@
 import logging
 import os
-import yaml
 
 from collections.abc import Mapping
 from typing import Any, Dict, Literal, Optional, Type
@@ -8,9 +7,11 @@ from typing import Any, Dict, Literal, Optional, Type
 from clipped.config.contexts import get_project_path, get_temp_path
 from clipped.config.reader import ConfigReader
 from clipped.config.schema import BaseSchemaModel
+from clipped.config.spec import ConfigHttpCache, ConfigSpec
 from clipped.utils.enums import PEnum
 from clipped.utils.json import orjson_dumps, orjson_loads
 from clipped.utils.paths import check_or_create_path
+from clipped.utils.yaml import safe_dump
 
 _logger = logging.getLogger("clipped.config.manager")
 
@@ -52,6 +53,25 @@ class ConfigManager:
         cls._TEMP_PATH = get_temp_path(cls._PROJECT)
         return cls._TEMP_PATH
 
+    @classmethod
+    def get_http_cache_path(cls) -> str:
+        return os.path.join(cls._get_temp_path(), "http_cache")
+
+    @classmethod
+    def enable_http_cache(
+        cls, offline: bool = False, stale_while_revalidate: bool = False
+    ) -> ConfigHttpCache:
+        """
+        Enables the HTTP cache of the config spec used to read `CONFIG`,
+        under the temp path of the project, see `ConfigSpec.enable_http_cache`.
+        """
+        config_spec = getattr(cls.CONFIG, "_CONFIG_SPEC", ConfigSpec)
+        return config_spec.enable_http_cache(
+            path=cls.get_http_cache_path(),
+            offline=offline,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+
     @classmethod
     def is_global(cls, visibility: Optional[Visibility] = None) -> bool:
         visibility = visibility or cls.VISIBILITY
@@ -206,14 +226,12 @@ class ConfigManager:
                 )
                 dict_config = config.to_dict()
                 if cls.PERSIST_FORMAT == "yaml":
-                    config_file.write(
-                        yaml.safe_dump(dict_config, sort_keys=True, indent=2)
-                    )
+                    config_file.write(safe_dump(dict_config, sort_keys=True, indent=2))
                 else:
                     config_file.write(dict_config)
             elif isinstance(config, Mapping):
                 if cls.PERSIST_FORMAT == "yaml":
-                    config_file.write(yaml.safe_dump(config, sort_keys=True, indent=2))
+                    config_file.write(safe_dump(config, sort_keys=True, indent=2))
                 else:
                     config_file.write(orjson_dumps(config))
             else:
@@ -1,6 +1,7 @@
+import functools
 import logging
 
-from typing import Any, Callable, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from clipped.compact.pydantic import (
     NameFactory,
@@ -8,8 +9,11 @@ from clipped.compact.pydantic import (
     PydanticTypeError,
     PydanticValueError,
     ValidationError,
+    create_model,
     load_str_bytes,
     parse_obj_as,
+    parse_obj_as_cache_clear,
+    parse_obj_as_cache_info,
 )
 from clipped.config.constants import NO_VALUE_FOUND
 from clipped.config.exceptions import SchemaError
@@ -51,6 +55,15 @@ class ConfigParser:
     ) -> T:
         return parse_obj_as(type_, obj, **cls.type_forwarding())
 
+    @staticmethod
+    def parse_cache_info():
+        """Returns the hits/misses of the cached type adapters used for parsing."""
+        return parse_obj_as_cache_info()
+
+    @staticmethod
+    def parse_cache_clear():
+        parse_obj_as_cache_clear()
+
     @classmethod
     def parse_raw_as(
         cls,
@@ -76,7 +89,13 @@ class ConfigParser:
 
     @classmethod
     def _check_options(cls, key, value, options):
-        if options and value not in options:
+        if not options:
+            return
+        try:
+            is_valid = value in options
+        except TypeError:  # Unhashable value checked against a frozenset
+            is_valid = value in list(options)
+        if not is_valid:
             raise cls._SCHEMA_EXCEPTION(
                 "The value `{}` provided for key `{}` "
                 "is not one of the possible values.".format(value, key)
@@ -113,7 +132,7 @@ class ConfigParser:
             return default
 
         try:
-            if cls.is_loadable(target_type) and isinstance(value, str):
+            if isinstance(value, str) and cls.is_loadable(target_type):
                 new_value = cls.parse_raw_as(
                     target_type, value, json_loads=orjson_loads
                 )
@@ -170,21 +189,7 @@ class ConfigParser:
             Returns:
                  `target_type`: value corresponding to the key.
             """
-            _target_type = cls.type_mapping().get(target_type, target_type)
-
-            def _get_name():
-                if hasattr(_target_type, "_name"):
-                    return _target_type._name
-                if hasattr(_target_type, "__name__"):
-                    return _target_type.__name__
-                return "Any"
-
-            if is_list:
-                # _target_type = (
-                #     _target_type if isinstance(_target_type, str) else _get_name()
-                # )
-                # _target_type = f"List[{_target_type}]"
-                _target_type = List[_target_type]
+            _target_type = cls.get_target_type(target_type, is_list=is_list)
 
             return cls._get_typed_value(
                 key=key,
@@ -196,3 +201,135 @@ class ConfigParser:
             )
 
         return _parse
+
+    @classmethod
+    def get_target_type(cls, target_type: Any, is_list: bool = False) -> Any:
+        try:
+            _target_type = cls.type_mapping().get(target_type, target_type)
+        except TypeError:  # Unhashable types cannot be mapped
+            _target_type = target_type
+        if is_list:
+            _target_type = List[_target_type]
+        return _target_type
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def get_keys_model(target_types: Tuple[Any, ...]) -> Type:
+        """
+        Create a synthetic model with one field per target type.
+
+        Fields are named by position, `key_0`, `key_1`, ..., since config keys
+        are not necessarily valid identifiers,
+        and they all default to `None` so that missing values can be left out.
+        """
+        fields: Dict[str, Any] = {
+            "key_{}".format(i): (target_type, None)
+            for i, target_type in enumerate(target_types)
+        }
+        return create_model("ConfigKeys", **fields)
+
+    @classmethod
+    def parse_many(
+        cls, keys: List[Dict], values: Dict, model: Optional[Type] = None
+    ) -> Dict:
+        """
+        Get the values corresponding to several keys and validate them in a single pass.
+
+        Args
+            keys: list of key specs, each spec is a dict with a `key`, a `key_type`,
+                and optionally `is_list`, `is_optional`, `default`, and `options`,
+                the `target_type` is resolved if not already provided.
+            values: the dict to read the keys from.
+            model: the synthetic model to validate the values with,
+                created with `get_keys_model` if not provided,
+                the keys are validated one by one if no model can be created.
+
+        Returns:
+             `Dict`: the parsed values by key.
+        """
+        keys = [
+            spec
+            if "target_type" in spec
+            else dict(
+                spec,
+                target_type=cls.get_target_type(
+                    spec["key_type"], spec.get("is_list", False)
+                ),
+            )
+            for spec in keys
+        ]
+        if model is None:
+            try:
+                model = cls.get_keys_model(tuple(spec["target_type"] for spec in keys))
+            except TypeError:  # Unhashable target types cannot be cached
+                return {
+                    spec["key"]: cls._get_typed_value(
+                        key=spec["key"],
+                        value=values.get(spec["key"], NO_VALUE_FOUND),
+                        target_type=spec["target_type"],
+                        is_optional=spec.get("is_optional", False),
+                        default=spec.get("default"),
+                        options=spec.get("options"),
+                    )
+                    for spec in keys
+                }
+        return cls._get_typed_values(keys, values, model)
+
+    @classmethod
+    def _get_typed_values(cls, keys: List[Dict], values: Dict, model: Type) -> Dict:
+        results = {}
+        data = {}
+        for i, spec in enumerate(keys):
+            key = spec["key"]
+            value = values.get(key, NO_VALUE_FOUND)
+            if value is None or value == NO_VALUE_FOUND:
+                if not spec.get("is_optional"):
+                    raise cls._SCHEMA_EXCEPTION(
+                        "No value was provided for the non optional key `{}`.".format(
+                            key
+                        )
+                    )
+                results[key] = spec.get("default")
+                continue
+            if cls.is_loadable(spec["target_type"]) and isinstance(value, str):
+                try:
+                    value = orjson_loads(value)
+                except ValueError:
+                    raise cls._SCHEMA_EXCEPTION(
+                        "Cannot convert value `{}` (key: `{}`) to `{}`".format(
+                            value, key, spec["target_type"]
+                        )
+                    )
+            data["key_{}".format(i)] = value
+
+        model_validate_fct = (
+            model.model_validate
+            if hasattr(model, "model_validate")
+            else model.parse_obj
+        )
+        try:
+            parsed = model_validate_fct(data)
+        except (
+            TypeError,
+            ValueError,
+            ValidationError,
+            PydanticTypeError,
+            PydanticValueError,
+        ) as e:
+            spec = keys[0]
+            if isinstance(e, ValidationError) and e.errors():
+                spec = keys[int(str(e.errors()[0]["loc"][0])[len("key_") :])]
+            raise cls._SCHEMA_EXCEPTION(
+                "Cannot convert value `{}` (key: `{}`) to `{}`".format(
+                    values.get(spec["key"]), spec["key"], spec["target_type"]
+                )
+            )
+
+        for field in data:
+            spec = keys[int(field[len("key_") :])]
+            new_value = getattr(parsed, field)
+            cls._check_options(
+                key=spec["key"], value=new_value, options=spec.get("options")
+            )
+            results[spec["key"]] = new_value
+        return results
@@ -1,8 +1,63 @@
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Type, Union
+
 from clipped.config.constants import NO_VALUE_FOUND
 from clipped.config.parser import ConfigParser
 from clipped.config.spec import ConfigSpec
 
 
+class CompiledConfigSpec:
+    """
+    A list of key specs compiled once and applied to any number of config readers.
+
+    The target types, the list wrapping, the options, and the synthetic model
+    used for validation are all resolved at creation time.
+
+    usage example:
+        MY_KEYS = CompiledConfigSpec([
+            {"key": "FOO", "key_type": "int"},
+            {"key": "BAR", "key_type": "str", "is_list": True, "is_optional": True},
+        ])
+        values = MY_KEYS.apply(config)
+    """
+
+    def __init__(
+        self,
+        keys: Union[List[Dict], Dict[str, Dict]],
+        config_parser: Type[ConfigParser] = ConfigParser,
+    ):
+        if isinstance(keys, Mapping):
+            keys = [dict(spec, key=key) for key, spec in keys.items()]
+        self.config_parser = config_parser
+        self.keys = [self._compile_key(spec) for spec in keys]
+        self.model: Optional[Type]
+        try:
+            self.model = config_parser.get_keys_model(
+                tuple(spec["target_type"] for spec in self.keys)
+            )
+        except TypeError:  # Unhashable target types are validated one by one
+            self.model = None
+
+    def _compile_key(self, spec: Dict) -> Dict:
+        spec = dict(spec)
+        spec["target_type"] = self.config_parser.get_target_type(
+            spec["key_type"], spec.get("is_list", False)
+        )
+        options = spec.get("options")
+        if options:
+            try:
+                spec["options"] = frozenset(options)
+            except TypeError:  # Unhashable options
+                spec["options"] = tuple(options)
+        return spec
+
+    def parse(self, data: Dict) -> Dict[str, Any]:
+        return self.config_parser.parse_many(self.keys, data, model=self.model)
+
+    def apply(self, config: "ConfigReader") -> Dict[str, Any]:
+        return config.get_many(self)
+
+
 class ConfigReader:
     _CONFIG_SPEC = ConfigSpec
     _CONFIG_PARSER = ConfigParser
@@ -96,6 +151,33 @@ class ConfigReader:
             **kwargs,
         )
 
+    def get_many(
+        self, keys: Union[List[Dict], Dict[str, Dict], CompiledConfigSpec]
+    ) -> Dict[str, Any]:
+        """
+        Get the values corresponding to several keys and validate them in a single pass.
+
+        Args:
+            keys: list of key specs, each spec is a dict with the same arguments as `get`,
+                e.g. `{"key": "FOO", "key_type": "int", "is_optional": True}`,
+                or a dict of key specs by key, or a `CompiledConfigSpec`.
+
+        Returns:
+             `Dict`: values corresponding to the keys parsed to their key_type.
+        """
+        if not isinstance(keys, CompiledConfigSpec):
+            keys = CompiledConfigSpec(keys, config_parser=self._CONFIG_PARSER)
+        results = keys.parse(
+            {spec["key"]: self.get_value(spec["key"]) for spec in keys.keys}
+        )
+        for spec in keys.keys:
+            self._add_key(
+                spec["key"],
+                is_secret=spec.get("is_secret", False),
+                is_local=spec.get("is_local", False),
+            )
+        return results
+
     def get_value(self, key):
         return self._data.get(key, NO_VALUE_FOUND)
 
@@ -1,12 +1,44 @@
+import copy
+import datetime
+import decimal
 import functools
+import io
+import itertools
 import os
 import pprint
-import yaml
+import types
+import uuid
 
 from collections.abc import Mapping
-from typing import Any, ClassVar, Dict, List, Optional, Set, Type, Union
-
-from clipped.compact.pydantic import BaseModel, PydanticAllowConfig, PydanticConfig
+from enum import Enum
+from inspect import isclass
+from typing import (
+    Any,
+    BinaryIO,
+    ClassVar,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from clipped.compact.pydantic import (
+    PYDANTIC_VERSION,
+    SERIALIZER_TYPES,
+    AnyUrl,
+    BaseModel,
+    PydanticAllowConfig,
+    PydanticConfig,
+)
 from clipped.compact.pydantic import RootModel as BaseRootModel
 from clipped.compact.pydantic import create_model
 from clipped.config.exceptions import SchemaError
@@ -14,9 +46,397 @@ from clipped.config.patch_strategy import PatchStrategy
 from clipped.config.spec import ConfigSpec
 from clipped.utils.dicts import deep_update
 from clipped.utils.humanize import humanize_timesince
-from clipped.utils.json import orjson_dumps
+from clipped.utils.json import orjson_dumps, orjson_dumps_bytes
 from clipped.utils.strings import to_camel_case
 from clipped.utils.units import to_percentage, to_unit_memory
+from clipped.utils.yaml import safe_dump
+
+
+JSON_DUMP_CACHE_SIZE = 1024
+JSON_DUMP_CHUNK_SIZE = 1000
+_JSON_NATIVE_TYPES = (str, int, bool, type(None))
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def _has_custom_serializer(metadata: List) -> bool:
+    return any(isinstance(m, SERIALIZER_TYPES) for m in metadata)
+
+
+def _is_json_native_type(annotation: Any, seen: tuple) -> bool:
+    """
+    Checks if the values of a type are serialized the same way
+    by `orjson_dumps(model_dump(...))` and `model_dump_json(...)`.
+    """
+    if annotation is None or annotation in _JSON_NATIVE_TYPES:
+        return True
+    if hasattr(annotation, "__metadata__"):  # Annotated
+        return not _has_custom_serializer(
+            annotation.__metadata__
+        ) and _is_json_native_type(annotation.__origin__, seen)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in _UNION_TYPES:
+        return all(_is_json_native_type(arg, seen) for arg in args)
+    if origin is Literal:
+        return all(arg is None or isinstance(arg, (str, int)) for arg in args)
+    if origin in (list, tuple):
+        return bool(args) and all(
+            arg is Ellipsis or _is_json_native_type(arg, seen) for arg in args
+        )
+    if origin is dict:
+        return len(args) == 2 and args[0] is str and _is_json_native_type(args[1], seen)
+    if isclass(annotation):
+        if issubclass(annotation, Enum):
+            return issubclass(annotation, (str, int))
+        if issubclass(annotation, BaseModel):
+            return _is_json_native_model(annotation, seen)
+    return False
+
+
+@functools.lru_cache(maxsize=JSON_DUMP_CACHE_SIZE)
+def _is_json_native_model(model: Type[BaseModel], seen: tuple = ()) -> bool:
+    if not PYDANTIC_VERSION.startswith("2."):
+        return False
+    if model in seen:  # Recursive models
+        return True
+    decorators = model.__pydantic_decorators__
+    if (
+        getattr(model, "__pydantic_root_model__", False)
+        or model.model_config.get("extra") == "allow"
+        or model.model_computed_fields
+        or decorators.field_serializers
+        or decorators.model_serializers
+    ):
+        return False
+    seen = seen + (model,)
+    return all(
+        not _has_custom_serializer(field.metadata)
+        and _is_json_native_type(field.annotation, seen)
+        for field in model.model_fields.values()
+    )
+
+
+@functools.lru_cache(maxsize=JSON_DUMP_CACHE_SIZE)
+def _has_default_dump(cls: Type["BaseSchemaMixin"]) -> bool:
+    """
+    Checks if `cls` can be serialized directly by pydantic v2,
+    i.e. it does not customize the dump logic.
+    """
+    if not PYDANTIC_VERSION.startswith("2."):
+        return False
+    if cls._CUSTOM_DUMP_FIELDS or cls._SWAGGER_FIELDS:
+        return False
+    if BaseSchemaModel not in cls.__mro__:
+        return False
+    for klass in cls.__mro__[: cls.__mro__.index(BaseSchemaModel)]:
+        if any(
+            method in klass.__dict__
+            for method in ["to_dict", "obj_to_dict", "_dump_obj", "model_dump"]
+        ):
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=JSON_DUMP_CACHE_SIZE)
+def _can_dump_json(cls: Type["BaseSchemaMixin"]) -> bool:
+    """
+    Checks if `cls` can be serialized with `model_dump_json`,
+    i.e. it does not customize the dump logic and all its fields are JSON native.
+    """
+    return _has_default_dump(cls) and _is_json_native_model(cls)  # type: ignore[arg-type]
+
+
+_LAZY_VALUES_KEY = "__lazy_values__"
+
+
+def _has_model_type(annotation: Any) -> bool:
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return True
+    if hasattr(annotation, "__metadata__"):  # Annotated
+        return _has_model_type(annotation.__origin__)
+    return any(_has_model_type(arg) for arg in get_args(annotation))
+
+
+def _get_lazy_values(obj: Any) -> Optional[Dict[str, Any]]:
+    private = getattr(obj, "__pydantic_private__", None)
+    return private.get(_LAZY_VALUES_KEY) if private else None
+
+
+def _validate_lazy_value(obj: BaseModel, name: str, lazy_values: Dict[str, Any]):
+    # The lazy values can be shared with copies of the object, they are not modified
+    obj.__pydantic_validator__.validate_assignment(obj, name, lazy_values[name])
+    # The validated value is added last, the fields are put back in their order
+    values = obj.__dict__
+    ordered_values = {k: values[k] for k in type(obj).model_fields if k in values}
+    ordered_values.update(values)
+    values.clear()
+    values.update(ordered_values)
+    if lazy_values.keys() <= obj.__dict__.keys():
+        private = {
+            k: v
+            for k, v in obj.__pydantic_private__.items()  # type: ignore[union-attr]
+            if k != _LAZY_VALUES_KEY
+        }
+        object.__setattr__(
+            obj,
+            "__pydantic_private__",
+            private if obj.__private_attributes__ else None,
+        )
+
+
+_ATOMIC_TYPES = frozenset([str, bytes, int, float, bool, type(None)])
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    type(None),
+    Enum,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    uuid.UUID,
+    AnyUrl,
+)
+
+
+def _copy_model(value: BaseModel, memo: Dict[int, Any], share_immutable: bool):
+    if not PYDANTIC_VERSION.startswith("2."):
+        result = value.copy()
+        memo[id(value)] = result
+        values = result.__dict__
+        for k, v in values.items():
+            if type(v) not in _ATOMIC_TYPES:
+                values[k] = _copy_structure(v, memo, share_immutable)
+        return result
+
+    # Same as `model_copy` but the values are copied in a single pass
+    model_type = type(value)
+    result = model_type.__new__(model_type)
+    memo[id(value)] = result
+    object.__setattr__(
+        result,
+        "__dict__",
+        {
+            k: v
+            if type(v) in _ATOMIC_TYPES
+            else _copy_structure(v, memo, share_immutable)
+            for k, v in value.__dict__.items()
+        },
+    )
+    extra = value.__pydantic_extra__
+    object.__setattr__(
+        result,
+        "__pydantic_extra__",
+        None
+        if extra is None
+        else {k: _copy_structure(v, memo, share_immutable) for k, v in extra.items()},
+    )
+    object.__setattr__(
+        result, "__pydantic_fields_set__", set(value.__pydantic_fields_set__)
+    )
+    private = value.__pydantic_private__
+    object.__setattr__(
+        result,
+        "__pydantic_private__",
+        None
+        if private is None
+        else {k: _copy_structure(v, memo, share_immutable) for k, v in private.items()},
+    )
+    return result
+
+
+def _copy_structure(value: Any, memo: Dict[int, Any], share_immutable: bool) -> Any:
+    """
+    Copies the models, lists, dicts, and sets of an already validated value
+    without serializing and validating it again.
+
+    Atomic values are always shared with the copy, other immutable values,
+    e.g. urls or frozen models, are only shared if `share_immutable` is set.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    value_id = id(value)
+    if value_id in memo:
+        return memo[value_id]
+
+    result: Any
+    if value_type is list:
+        result = []
+        memo[value_id] = result
+        result.extend(
+            v if type(v) in _ATOMIC_TYPES else _copy_structure(v, memo, share_immutable)
+            for v in value
+        )
+        return result
+    if value_type is dict:
+        result = {}
+        memo[value_id] = result
+        for k, v in value.items():
+            result[k] = (
+                v
+                if type(v) in _ATOMIC_TYPES
+                else _copy_structure(v, memo, share_immutable)
+            )
+        return result
+    if isinstance(value, BaseModel):
+        if share_immutable and getattr(value, "model_config", {}).get("frozen"):
+            return value
+        return _copy_model(value, memo, share_immutable)
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value if share_immutable else copy.deepcopy(value, memo)
+
+    if value_type in (tuple, frozenset):
+        items = [_copy_structure(v, memo, share_immutable) for v in value]
+        if all(i is v for i, v in zip(items, value)):
+            result = value
+        else:
+            result = value_type(items)
+    elif value_type is set:
+        result = set(value)
+    else:
+        result = copy.deepcopy(value, memo)
+    memo[value_id] = result
+    return result
+
+
+class SchemaMetadata:
+    """
+    Fields metadata of a schema class, computed once on first use, see `get_metadata`.
+
+    The metadata is recomputed if the `model_fields` or the patch fields of the class
+    are reassigned, the returned dicts and sets should not be modified.
+    """
+
+    __slots__ = (
+        "sources",
+        "aliases",
+        "reverse_aliases",
+        "all_possible_keys",
+        "fields_manual_patch",
+        "fields_same_kind_patch",
+        "fields_dict_patch",
+        "swagger_fields",
+        "swagger_fields_lists",
+        "default_keys",
+        "patch_plan",
+        "patch_plan_index",
+        "lazy_keys",
+    )
+
+    def __init__(self, cls: Type["BaseSchemaModel"]):
+        self.sources = self.get_sources(cls)
+        self.aliases: Dict[str, Optional[str]] = {
+            field_name: field_info.alias
+            for field_name, field_info in cls.model_fields.items()
+        }
+        self.reverse_aliases = {
+            alias: field_name
+            for field_name, alias in self.aliases.items()
+            if alias is not None
+        }
+        self.all_possible_keys = frozenset(self.aliases.keys()) | frozenset(
+            self.aliases.values()
+        )
+        self.fields_manual_patch = frozenset(cls._FIELDS_MANUAL_PATCH)
+        self.fields_same_kind_patch = frozenset(cls._FIELDS_SAME_KIND_PATCH)
+        self.fields_dict_patch = frozenset(cls._FIELDS_DICT_PATCH)
+        self.swagger_fields = frozenset(cls._SWAGGER_FIELDS)
+        self.swagger_fields_lists = frozenset(cls._SWAGGER_FIELDS_LISTS)
+        # Fields that can have a non null value without being set
+        self.default_keys = frozenset(
+            field_name
+            for field_name, field_info in cls.model_fields.items()
+            if not field_info.is_required()
+            and (
+                field_info.default_factory is not None or field_info.default is not None
+            )
+        )
+        self.patch_plan = self.get_patch_plan(cls.model_fields)
+        self.patch_plan_index = self.get_patch_plan_index(self.patch_plan)
+        self.lazy_keys = self.get_lazy_keys(cls)
+
+    def get_patch_plan(self, fields: Iterable[str]) -> tuple:
+        """
+        Classifies the fields once for `patch_obj`,
+        returns a tuple of `(key, is_same_kind, is_dict, is_swagger, is_swagger_list)`.
+
+        Manual patch fields are not part of the plan.
+        """
+        return tuple(
+            (
+                key,
+                key in self.fields_same_kind_patch,
+                key in self.fields_dict_patch,
+                key in self.swagger_fields,
+                key in self.swagger_fields_lists,
+            )
+            for key in fields
+            if key not in self.fields_manual_patch
+        )
+
+    @staticmethod
+    def get_patch_plan_index(patch_plan: Sequence[tuple]) -> Dict[str, tuple]:
+        """Maps the keys of a patch plan to their `(position, entry)`."""
+        return {entry[0]: (i, entry) for i, entry in enumerate(patch_plan)}
+
+    @staticmethod
+    def get_lazy_keys(cls: Type["BaseSchemaModel"]) -> Dict[str, str]:
+        """
+        Maps the input keys of the fields that can be validated lazily to their names,
+        i.e. the optional fields holding nested models, see `from_dict_lazy`.
+
+        Models with model validators or frozen models are always validated eagerly.
+        """
+        if not PYDANTIC_VERSION.startswith("2."):
+            return {}
+        config = cls.model_config
+        decorators = cls.__pydantic_decorators__
+        if (
+            getattr(cls, "__pydantic_root_model__", False)
+            or config.get("frozen")
+            or decorators.model_validators
+            or decorators.root_validators
+        ):
+            return {}
+        by_name = config.get("populate_by_name") or config.get("validate_by_name")
+        by_alias = config.get("validate_by_alias", True)
+        lazy_keys = {}
+        for field_name, field_info in cls.model_fields.items():
+            if (
+                field_info.is_required()
+                or field_info.frozen
+                or not _has_model_type(field_info.annotation)
+            ):
+                continue
+            alias = field_info.validation_alias or field_info.alias
+            if alias is not None and not isinstance(alias, str):  # AliasChoices
+                continue
+            if alias and by_alias:
+                lazy_keys[alias] = field_name
+            if not alias or by_name or not by_alias:
+                lazy_keys[field_name] = field_name
+        return lazy_keys
+
+    @staticmethod
+    def get_sources(cls: Type["BaseSchemaModel"]) -> tuple:
+        return (
+            cls.model_fields,
+            cls._FIELDS_MANUAL_PATCH,
+            cls._FIELDS_SAME_KIND_PATCH,
+            cls._FIELDS_DICT_PATCH,
+            cls._SWAGGER_FIELDS,
+            cls._SWAGGER_FIELDS_LISTS,
+        )
+
+    def is_valid(self, cls: Type["BaseSchemaModel"]) -> bool:
+        return all(
+            cached is current
+            for cached, current in zip(self.sources, self.get_sources(cls))
+        )
 
 
 class BaseSchemaMixin:
@@ -39,13 +459,24 @@ class BaseSchemaMixin:
     _CONFIG_SPEC: ClassVar = ConfigSpec
     _SCHEMA_EXCEPTION: ClassVar = SchemaError
     _USE_DISCRIMINATOR: ClassVar = False
+    __schema_metadata__: ClassVar["SchemaMetadata"]
+
+    @classmethod
+    def get_metadata(cls) -> SchemaMetadata:
+        # Looked up in the class `__dict__`, subclasses have their own metadata
+        metadata = cls.__dict__.get("__schema_metadata__")
+        if metadata is None or not metadata.is_valid(cls):
+            metadata = SchemaMetadata(cls)  # type: ignore[arg-type]
+            cls.__schema_metadata__ = metadata
+        return metadata
 
     @classmethod
     def get_aliases(cls):
-        return {
-            field_name: field_info.alias
-            for field_name, field_info in cls.model_fields.items()
-        }
+        return cls.get_metadata().aliases
+
+    @classmethod
+    def get_field_for_alias(cls, alias: str) -> Optional[str]:
+        return cls.get_metadata().reverse_aliases.get(alias)
 
     @classmethod
     def get_field_name(cls, field):
@@ -54,7 +485,7 @@ class BaseSchemaMixin:
     @classmethod
     def get_alias_for_field(cls, field):
         key = cls.get_field_name(field)
-        return cls.get_aliases().get(key)
+        return cls.get_metadata().aliases.get(key)
 
     @classmethod
     def get_value_for_key(cls, key, obj):
@@ -130,7 +561,7 @@ class BaseSchemaMixin:
             exclude_none=exclude_none,
             exclude_defaults=exclude_defaults,
         )
-        return yaml.safe_dump(obj, sort_keys=True, indent=2)
+        return safe_dump(obj, sort_keys=True, indent=2)
 
     def to_json(
         self,
@@ -141,6 +572,16 @@ class BaseSchemaMixin:
         exclude_none: bool = True,
         exclude_defaults: bool = False,
     ) -> str:
+        if not any([humanize_values, include_kind, include_version]) and _can_dump_json(
+            self.__class__  # type: ignore[arg-type]
+        ):
+            self.validate_all()
+            return self.model_dump_json(  # type: ignore[attr-defined]
+                by_alias=True,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
         obj = self.to_dict(
             humanize_values=humanize_values,
             include_kind=include_kind,
@@ -151,6 +592,189 @@ class BaseSchemaMixin:
         )
         return orjson_dumps(obj)
 
+    @classmethod
+    def _get_many_adapter(
+        cls,
+        objs: List["BaseSchemaModel"],
+        humanize_values: bool,
+        include_kind: bool,
+        include_version: bool,
+        json: bool,
+    ) -> Optional[Any]:
+        """
+        Returns a cached `TypeAdapter(List[cls])` if the objects can be serialized
+        directly by pydantic, `None` otherwise.
+        """
+        if any([humanize_values, include_kind, include_version]):
+            return None
+        if not (_can_dump_json(cls) if json else _has_default_dump(cls)):  # type: ignore[arg-type]
+            return None
+        if any(obj.__class__ is not cls for obj in objs):
+            return None
+
+        from clipped.compact.pydantic import get_type_adapter
+
+        return get_type_adapter(List[cls])  # type: ignore[valid-type]
+
+    @classmethod
+    def dump_many(
+        cls,
+        objs: List["BaseSchemaModel"],
+        humanize_values: bool = False,
+        include_kind: bool = False,
+        include_version: bool = False,
+        exclude_unset: bool = True,
+        exclude_none: bool = True,
+        exclude_defaults: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Similar to calling `to_dict` on each object,
+        the objects are serialized at once when possible.
+        """
+        adapter = cls._get_many_adapter(
+            objs, humanize_values, include_kind, include_version, json=False
+        )
+        if adapter is not None:
+            for obj in objs:
+                obj.validate_all()
+            return adapter.dump_python(
+                objs,
+                by_alias=True,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+        return [
+            obj.to_dict(
+                humanize_values=humanize_values,
+                include_kind=include_kind,
+                include_version=include_version,
+                exclude_unset=exclude_unset,
+                exclude_none=exclude_none,
+                exclude_defaults=exclude_defaults,
+            )
+            for obj in objs
+        ]
+
+    @classmethod
+    def _dump_json_chunk(
+        cls,
+        objs: List["BaseSchemaModel"],
+        json_lines: bool,
+        humanize_values: bool,
+        include_kind: bool,
+        include_version: bool,
+        exclude_unset: bool,
+        exclude_none: bool,
+        exclude_defaults: bool,
+    ) -> bytes:
+        adapter = cls._get_many_adapter(
+            objs, humanize_values, include_kind, include_version, json=True
+        )
+        if adapter is not None:
+            for obj in objs:
+                obj.validate_all()
+            dump_kwargs: Dict[str, Any] = dict(
+                by_alias=True,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+            if json_lines:
+                from clipped.compact.pydantic import get_type_adapter
+
+                obj_adapter = get_type_adapter(cls)
+                return b"".join(
+                    obj_adapter.dump_json(obj, **dump_kwargs) + b"\n" for obj in objs
+                )
+            return adapter.dump_json(objs, **dump_kwargs)[1:-1]
+
+        data = cls.dump_many(
+            objs,
+            humanize_values=humanize_values,
+            include_kind=include_kind,
+            include_version=include_version,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude_defaults=exclude_defaults,
+        )
+        if json_lines:
+            return b"".join(orjson_dumps_bytes(d) + b"\n" for d in data)
+        return orjson_dumps_bytes(data)[1:-1]
+
+    @classmethod
+    def write_json_many(
+        cls,
+        objs: Iterable["BaseSchemaModel"],
+        stream: BinaryIO,
+        json_lines: bool = False,
+        chunk_size: int = JSON_DUMP_CHUNK_SIZE,
+        humanize_values: bool = False,
+        include_kind: bool = False,
+        include_version: bool = False,
+        exclude_unset: bool = True,
+        exclude_none: bool = True,
+        exclude_defaults: bool = False,
+    ) -> int:
+        """
+        Writes the objects to a binary stream, as a JSON array or as JSON lines,
+        by chunks of `chunk_size` objects, and returns the number of objects written.
+
+        The output is the same as calling `to_json` on each object.
+        """
+        objs = iter(objs)
+        num_objs = 0
+        if not json_lines:
+            stream.write(b"[")
+        while True:
+            chunk = list(itertools.islice(objs, chunk_size))
+            if not chunk:
+                break
+            data = cls._dump_json_chunk(
+                chunk,
+                json_lines=json_lines,
+                humanize_values=humanize_values,
+                include_kind=include_kind,
+                include_version=include_version,
+                exclude_unset=exclude_unset,
+                exclude_none=exclude_none,
+                exclude_defaults=exclude_defaults,
+            )
+            if num_objs and not json_lines:
+                stream.write(b",")
+            stream.write(data)
+            num_objs += len(chunk)
+        if not json_lines:
+            stream.write(b"]")
+        return num_objs
+
+    @classmethod
+    def to_json_many(
+        cls,
+        objs: Iterable["BaseSchemaModel"],
+        json_lines: bool = False,
+        humanize_values: bool = False,
+        include_kind: bool = False,
+        include_version: bool = False,
+        exclude_unset: bool = True,
+        exclude_none: bool = True,
+        exclude_defaults: bool = False,
+    ) -> str:
+        """Serializes the objects as a JSON array or as JSON lines, see `write_json_many`."""
+        stream = io.BytesIO()
+        cls.write_json_many(
+            objs,
+            stream,
+            json_lines=json_lines,
+            humanize_values=humanize_values,
+            include_kind=include_kind,
+            include_version=include_version,
+            exclude_unset=exclude_unset,
+            exclude_none=exclude_none,
+            exclude_defaults=exclude_defaults,
+        )
+        return stream.getvalue().decode()
+
     def to_str(self) -> str:
         model_dump_fct = self.model_dump if hasattr(self, "model_dump") else self.dict
         return pprint.pformat(model_dump_fct(by_alias=True))
@@ -206,9 +830,10 @@ class BaseSchemaMixin:
         exclude_none: bool = True,
         exclude_defaults: bool = False,
     ) -> Dict:
+        obj.validate_all()
         humanized_attrs = cls.humanize_attrs(obj) if humanize_values else {}
         model_dump_fct = obj.model_dump if hasattr(obj, "model_dump") else obj.dict
-        data_dict = model_dump_fct(
+        data_dict = model_dump_fct(  # type: ignore[operator]
             by_alias=True,
             exclude_unset=exclude_unset,
             exclude_defaults=exclude_defaults,
@@ -252,11 +877,70 @@ class BaseSchemaMixin:
         )
         return model_validate_fct(value)
 
+    @classmethod
+    def from_dict_lazy(cls, value: Any, partial: bool = False) -> "BaseSchemaModel":
+        """
+        Similar to `from_dict`, but the optional fields holding nested models
+        are validated on first access, and cached, instead of when the object is created.
+
+        Use `validate_all` to validate the remaining fields at once,
+        the object is fully validated before it's serialized, copied, compared, or printed.
+        """
+        lazy_keys = cls.get_metadata().lazy_keys
+        if not lazy_keys or not isinstance(value, Mapping):
+            return cls.from_dict(value, partial=partial)
+
+        values = {}
+        lazy_values = {}
+        for key, key_value in value.items():
+            field_name = lazy_keys.get(key)
+            if field_name is None or field_name in lazy_values:
+                values[key] = key_value
+            else:
+                lazy_values[field_name] = key_value
+        obj = cls.from_dict(values, partial=partial)
+        if not lazy_values:
+            return obj
+
+        for field_name in lazy_values:
+            obj.__dict__.pop(field_name, None)
+        obj.__pydantic_fields_set__.update(lazy_values)
+        object.__setattr__(
+            obj,
+            "__pydantic_private__",
+            {**(obj.__pydantic_private__ or {}), _LAZY_VALUES_KEY: lazy_values},
+        )
+        return obj
+
+    def validate_all(self):
+        """
+        Validates the fields that were not accessed yet of an object created
+        with `from_dict_lazy`, e.g. `read(..., lazy=True)`, and returns the object.
+        """
+        lazy_values = _get_lazy_values(self)
+        if lazy_values:
+            for field_name in lazy_values:
+                if field_name not in self.__dict__:
+                    _validate_lazy_value(self, field_name, lazy_values)
+        return self
+
     @classmethod
     def read(
-        cls, values: Any, partial: bool = False, config_type: str = None
+        cls,
+        values: Any,
+        partial: bool = False,
+        config_type: str = None,
+        lazy: bool = False,
     ) -> "BaseSchemaModel":
+        """
+        Reads and validates the config values, see `ConfigSpec.read_from`.
+
+        If `lazy` is set, the nested models are validated on first access,
+        see `from_dict_lazy`.
+        """
         values = cls._CONFIG_SPEC.read_from(values, config_type=config_type)
+        if lazy:
+            return cls.from_dict_lazy(values, partial=partial)
         return cls.from_dict(values, partial=partial)
 
     @classmethod
@@ -270,8 +954,16 @@ class BaseSchemaMixin:
             if mode is not None:
                 os.chmod(filepath, mode)
 
-    def clone(self):
-        return self.from_dict(self.to_dict())
+    def clone(self, share_immutable: bool = False):
+        """
+        Returns a deep copy of the object, without serializing and validating it again,
+        the copy keeps the same fields set.
+
+        If `share_immutable` is set, only the mutable parts (models, lists, dicts, and sets)
+        are copied, immutable values, e.g. strings, urls, or frozen models,
+        are shared with the copy.
+        """
+        return _copy_structure(self, {}, share_immutable=share_immutable)
 
     @staticmethod
     def patch_normal_merge(
@@ -280,10 +972,11 @@ class BaseSchemaMixin:
         strategy = strategy or PatchStrategy.POST_MERGE
 
         if isinstance(current_value, dict):
+            # The nested dicts are copied, the result does not share them with the inputs
             if PatchStrategy.is_post_merge(strategy):
-                return deep_update(current_value, value)
+                return deep_update(deep_update({}, current_value), value)
             elif PatchStrategy.is_pre_merge(strategy):
-                return deep_update(value, current_value)
+                return deep_update(deep_update({}, value), current_value)
         elif isinstance(current_value, list):
             if PatchStrategy.is_post_merge(strategy):
                 return current_value + [i for i in value if i not in current_value]
@@ -298,7 +991,7 @@ class BaseSchemaMixin:
                 return deep_update(value.to_dict(), current_value.to_dict())
         else:
             if PatchStrategy.is_post_merge(strategy):
-                return value
+                return deep_update({}, value) if isinstance(value, dict) else value
             elif PatchStrategy.is_pre_merge(strategy):
                 return current_value
 
@@ -345,57 +1038,109 @@ class BaseSchemaMixin:
 
         return cls.patch_normal_merge(current_value, value, strategy)
 
+    @staticmethod
+    def get_patch_keys(
+        values: Any,
+    ) -> Tuple[Optional[Collection[str]], Collection[str]]:
+        """
+        Returns the keys that can be patched from `values`, or `None` if all fields
+        should be checked, and the keys explicitly set, which are patched even if null.
+        """
+        if isinstance(values, Mapping):
+            return values, values
+        if isinstance(values, BaseSchemaModel):
+            fields_set = values.model_fields_set
+            return fields_set | values.get_metadata().default_keys, fields_set
+        return None, set()
+
     @classmethod
     def patch_obj(
         cls,
         config: Union[Dict, "BaseSchemaModel"],
         values: Union[Dict, "BaseSchemaModel"],
         strategy: Optional[PatchStrategy] = None,
+        sparse: bool = False,
+        batch_assignments: bool = False,
     ):
+        """
+        Patches `config` with `values` following the `strategy`.
+
+        If `sparse` is set, only the fields explicitly set in `values`
+        (`model_fields_set` or the dict keys) are patched,
+        fields with non null defaults that are not set are ignored.
+        If `batch_assignments` is set, the new values are assigned at the end
+        and the model is validated once, instead of once per assigned field,
+        which pays off when many fields are assigned, see `set_values`.
+        """
         strategy = strategy or PatchStrategy.POST_MERGE
+        metadata = cls.get_metadata()
+        patch_plan: Sequence[tuple] = (
+            metadata.patch_plan
+            if config.__class__ is cls
+            else metadata.get_patch_plan(config.model_fields.keys())  # type: ignore[union-attr, arg-type]
+        )
+        patch_keys, set_keys = cls.get_patch_keys(values)
+        if sparse and patch_keys is not None:
+            patch_plan_index = (
+                metadata.patch_plan_index
+                if patch_plan is metadata.patch_plan
+                else metadata.get_patch_plan_index(patch_plan)
+            )
+            patch_plan = [
+                entry
+                for _, entry in sorted(
+                    patch_plan_index[key] for key in set_keys if key in patch_plan_index
+                )
+            ]
+        updates: Optional[Dict[str, Any]] = {} if batch_assignments else None
 
-        for key in config.model_fields.keys():
-            if key in cls._FIELDS_MANUAL_PATCH:
-                continue
+        def set_value(key: str, value: Any):
+            if updates is None:
+                setattr(config, key, value)
+            else:
+                updates[key] = value
+
+        def patch_value(value: Any, new_value: Any):
+            if sparse or batch_assignments:
+                value.patch(
+                    new_value,
+                    strategy=strategy,
+                    sparse=sparse,
+                    batch_assignments=batch_assignments,
+                )
+            else:
+                value.patch(new_value, strategy=strategy)
+
+        is_null = PatchStrategy.is_null(strategy)
+        is_replace = PatchStrategy.is_replace(strategy)
+        is_post_merge = PatchStrategy.is_post_merge(strategy)
+        is_pre_merge = PatchStrategy.is_pre_merge(strategy)
 
+        for key, is_same_kind, is_dict, is_swagger, is_swagger_list in patch_plan:
+            # Values that are not set or null are skipped,
+            # unless they are explicitly set to null
+            if patch_keys is not None and key not in patch_keys:
+                continue
             value = getattr(values, key, None)
-            if value is None:
-                should_continue = True
-                if isinstance(values, Mapping) and key in values:
-                    should_continue = False
-                elif (
-                    isinstance(values, BaseSchemaModel)
-                    and key in values.model_fields_set
-                ):
-                    should_continue = False
-
-                if should_continue:
-                    continue
+            if value is None and key not in set_keys:
+                continue
 
             current_value = getattr(config, key, None)
             if current_value is None:
-                setattr(
-                    config, key, value
-                )  # handles also PatchStrategy.ISNULL implicitly
+                set_value(key, value)  # handles also PatchStrategy.ISNULL implicitly
                 continue
 
-            if (
-                isinstance(current_value, BaseSchemaModel)
-                and key not in cls._FIELDS_SAME_KIND_PATCH
-            ):
-                current_value.patch(value, strategy=strategy)
-                continue
-
-            if isinstance(current_value, Mapping) and key in cls._FIELDS_DICT_PATCH:
+            if isinstance(current_value, BaseSchemaModel):
+                if not is_same_kind:
+                    patch_value(current_value, value)
+                    continue
+            elif isinstance(current_value, Mapping) and is_dict:
                 for k, v in current_value.items():
-                    v.patch(value.get(k, {}), strategy=strategy)
+                    patch_value(v, value.get(k, {}))
                 continue
-            if not isinstance(current_value, BaseSchemaModel) and (
-                hasattr(current_value, "openapi_types") or key in cls._SWAGGER_FIELDS
-            ):
-                if key in cls._SWAGGER_FIELDS_LISTS:  # Special case for lists
-                    setattr(
-                        config,
+            elif is_swagger or hasattr(current_value, "openapi_types"):
+                if is_swagger_list:  # Special case for lists
+                    set_value(
                         key,
                         cls.patch_swagger_field_list(current_value, value, strategy),
                     )
@@ -403,60 +1148,128 @@ class BaseSchemaMixin:
                     cls.patch_swagger_field(current_value, value, strategy)
                 continue
 
-            if PatchStrategy.is_null(strategy):
+            if is_null:
                 continue
-            if PatchStrategy.is_replace(strategy):
-                setattr(config, key, value)
+            if is_replace:
+                set_value(key, value)
                 continue
 
             # We only handle merge strategies
-            def normal_merge():
-                setattr(
-                    config, key, cls.patch_normal_merge(current_value, value, strategy)
-                )
-
-            def same_kind_merge():
-                # If the same kind resume merge patch using base logic
-                if value and current_value.kind == value.kind:
-                    normal_merge()
+            if (is_same_kind or value is None) and not (
+                value and current_value.kind == value.kind
+            ):
                 # Not same kind use post/pre replace
-                else:
-                    if PatchStrategy.is_post_merge(strategy):
-                        setattr(config, key, value)
-                    elif PatchStrategy.is_pre_merge(strategy):
-                        setattr(config, key, current_value)
-
-            if key in cls._FIELDS_SAME_KIND_PATCH or value is None:
-                same_kind_merge()
+                if is_post_merge:
+                    set_value(key, value)
+                elif is_pre_merge:
+                    set_value(key, current_value)
             else:
-                normal_merge()
+                # If the same kind resume merge patch using base logic
+                set_value(key, cls.patch_normal_merge(current_value, value, strategy))
 
+        if updates:
+            cls.set_values(config, updates)  # type: ignore[arg-type]
         return config
 
+    @staticmethod
+    def set_values(config: "BaseSchemaModel", values: Dict[str, Any]):
+        """
+        Assigns several fields at once, the model is validated once
+        with the new values instead of once per field.
+
+        Nested models that are already instances are not revalidated,
+        and `config` is not modified if the validation fails.
+        """
+        if not PYDANTIC_VERSION.startswith("2.") or not values:
+            for key, value in values.items():
+                setattr(config, key, value)
+            return
+
+        fields = config.__class__.model_fields
+        by_name = config.model_config.get("populate_by_name")
+        aliases = config.get_metadata().aliases
+        # All the current values are validated, the fields that are not set
+        # keep their values, e.g. a mutated default list
+        data = {}
+        for key in fields:
+            data_key = key if by_name else (aliases.get(key) or key)
+            data[data_key] = values[key] if key in values else getattr(config, key)
+        if config.__pydantic_extra__:
+            data.update(config.__pydantic_extra__)
+
+        validated = config.__class__.model_validate(data)
+        config.__dict__.update(validated.__dict__)
+        object.__setattr__(
+            config,
+            "__pydantic_fields_set__",
+            config.model_fields_set | (values.keys() & fields.keys()),
+        )
+        object.__setattr__(config, "__pydantic_extra__", validated.__pydantic_extra__)
+
     def patch(
         self,
         values: Union[Dict, "BaseSchemaModel"],
         strategy: Optional[PatchStrategy] = None,
+        sparse: bool = False,
+        batch_assignments: bool = False,
     ):
         strategy = strategy or PatchStrategy.POST_MERGE
-        return self.patch_obj(self, values, strategy)
+        return self.patch_obj(
+            self,
+            values,
+            strategy,
+            sparse=sparse,
+            batch_assignments=batch_assignments,
+        )
 
     @classmethod
-    def get_keys_and_aliases(cls) -> Dict[str, str]:
-        return {key: field.alias for key, field in cls.model_fields.items()}
+    def get_keys_and_aliases(cls) -> Dict[str, Optional[str]]:
+        return cls.get_metadata().aliases
 
     @classmethod
-    def get_all_possible_keys(cls) -> Set[str]:
-        keys_and_aliases = cls.get_keys_and_aliases()
-        all_keys = {key for key, value in keys_and_aliases.items()}
-        all_aliases = {value for key, value in keys_and_aliases.items()}
-        return all_keys | all_aliases
+    def get_all_possible_keys(cls) -> FrozenSet[Optional[str]]:
+        return cls.get_metadata().all_possible_keys
 
 
 class BaseSchemaModel(BaseModel, BaseSchemaMixin):
     class Config(PydanticConfig):
         pass
 
+    if PYDANTIC_VERSION.startswith("2."):
+
+        def __getattr__(self, item: str) -> Any:
+            # Only called for the fields that are not validated yet, see `from_dict_lazy`
+            if not item.startswith("_"):
+                lazy_values = _get_lazy_values(self)
+                if lazy_values and item in lazy_values:
+                    _validate_lazy_value(self, item, lazy_values)
+                    return self.__dict__[item]
+            # Only defined at runtime by pydantic, to look up the private attributes
+            return super().__getattr__(item)  # type: ignore[misc]
+
+        # The fields that are not validated yet are validated first, see `from_dict_lazy`
+        def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+            self.validate_all()
+            return super().model_dump(**kwargs)
+
+        def model_dump_json(self, **kwargs: Any) -> str:
+            self.validate_all()
+            return super().model_dump_json(**kwargs)
+
+        def model_copy(self, **kwargs: Any) -> "BaseSchemaModel":
+            self.validate_all()
+            return super().model_copy(**kwargs)
+
+        def __eq__(self, other: Any) -> bool:
+            self.validate_all()
+            if isinstance(other, BaseSchemaMixin):
+                other.validate_all()
+            return super().__eq__(other)
+
+        def __repr_args__(self) -> Any:
+            self.validate_all()
+            return super().__repr_args__()
+
 
 class RootModel(BaseRootModel, BaseSchemaMixin):
     pass
@@ -1,31 +1,315 @@
+import asyncio
+import copy
+import logging
 import os
+import re
 import sys
-import yaml
+import threading
+import time
 
+from collections import OrderedDict
 from collections.abc import Mapping
-from requests import HTTPError
-from typing import Any, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests import HTTPError, RequestException, Session
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+)
 from yaml.parser import ParserError
 from yaml.scanner import ScannerError
 
+from clipped.config.contexts import get_temp_path
 from clipped.config.exceptions import SchemaError
-from clipped.utils.dicts import deep_update
-from clipped.utils.json import orjson_loads
+from clipped.utils.dicts import deep_merge, deep_update
+from clipped.utils.hashing import hash_value
+from clipped.utils.json import orjson_dumps, orjson_loads
 from clipped.utils.lists import to_list
+from clipped.utils.paths import check_or_create_path
+from clipped.utils.workers import get_pool_workers
+from clipped.utils.yaml import safe_load, safe_load_all
+
+
+_logger = logging.getLogger("clipped.config.spec")
+
+JSON_STREAM_REGEX = re.compile(r"\s*[\[{]")
+JSON_BYTES_STREAM_REGEX = re.compile(rb"\s*[\[{]")
+
+
+class ConfigFileCache:
+    """
+    A process-wide LRU cache of parsed config files.
+
+    Entries are keyed on the file's absolute path, mtime, size, and inode,
+    so any change to the file invalidates its entry,
+    and are evicted by entry count and by total file size.
+    The byte budget counts the size of the source files on disk,
+    not the memory used by the parsed values.
+    Values are deep-copied on read so that callers can mutate the results.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(
+        f_path: str, stat: os.stat_result, file_type: Optional[str] = None
+    ) -> Tuple:
+        return f_path, stat.st_mtime_ns, stat.st_size, stat.st_ino, file_type
+
+    def get(
+        self,
+        f_path: str,
+        file_type: Optional[str],
+        read_fct: Callable[[TextIO, Optional[str]], Any],
+    ) -> Any:
+        f_path = os.path.abspath(f_path)
+        # The key and the value are both read from the opened file,
+        # so that a concurrent write cannot pair the old key with the new content
+        with open(f_path) as f:
+            key = self.get_key(f_path, os.fstat(f.fileno()), file_type)
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(self._entries[key])
+                self.misses += 1
+
+            value = read_fct(f, file_type)
+        self.set(key, value)
+        return copy.deepcopy(value)
+
+    def set(self, key: Tuple, value: Any):
+        size = key[2]
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._total_bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._total_bytes > self.max_bytes
+            ):
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_key[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ConfigHttpCache:
+    """
+    An on-disk cache of remote config documents validated with conditional requests.
+
+    Responses are stored with their `ETag` and `Last-Modified` headers,
+    and revalidated with `If-None-Match`/`If-Modified-Since`, a `304` is served from the cache.
+    Immutable documents, and all documents in `offline` mode, are served from the cache
+    without any request. With `stale_while_revalidate` cached documents are served
+    immediately and revalidated in the background.
+    The cached document is also served if the server cannot be reached.
+
+    Background revalidations run on at most `max_revalidations` threads,
+    and a document is only revalidated once at a time.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        offline: bool = False,
+        stale_while_revalidate: bool = False,
+        schema_exception: Type[Exception] = SchemaError,
+        max_revalidations: int = 2,
+    ):
+        self.path = path
+        self.offline = offline
+        self.stale_while_revalidate = stale_while_revalidate
+        self.schema_exception = schema_exception
+        self.max_revalidations = max_revalidations
+        self._revalidations: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def get_entry_path(self, url: str) -> str:
+        return os.path.join(self.path, "{}.json".format(hash_value(url, None)))
+
+    def get_entry(self, url: str) -> Optional[Dict]:
+        entry_path = self.get_entry_path(url)
+        if not os.path.isfile(entry_path):
+            return None
+        try:
+            with open(entry_path, "rb") as f:
+                entry = orjson_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("url") == url else None
+
+    def set_entry(self, url: str, content: str, headers: Mapping):
+        check_or_create_path(self.path, is_dir=True)
+        entry = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content": content,
+        }
+        entry_path = self.get_entry_path(url)
+        tmp_path = "{}.{}.tmp".format(entry_path, threading.get_ident())
+        with open(tmp_path, "w") as f:
+            f.write(orjson_dumps(entry))
+        os.replace(tmp_path, entry_path)
+
+    @staticmethod
+    def get_conditional_headers(entry: Optional[Dict]) -> Dict:
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def fetch(
+        self, url: str, entry: Optional[Dict], session: Optional[Session] = None
+    ) -> str:
+        from clipped.utils.requests import safe_request
+
+        try:
+            resp = safe_request(
+                url, headers=self.get_conditional_headers(entry), session=session
+            )
+        except RequestException:
+            if entry:
+                _logger.debug("Could not reach `%s`, using the cached config", url)
+                return entry["content"]
+            raise
+        if resp.status_code == 304 and entry:
+            return entry["content"]
+        resp.raise_for_status()
+        content = resp.content.decode()
+        self.set_entry(url, content, resp.headers)
+        return content
+
+    async def afetch(
+        self, url: str, entry: Optional[Dict], session: Optional[Any] = None
+    ) -> str:
+        from clipped.utils.async_requests import aiohttp, async_safe_request
+
+        try:
+            resp = await async_safe_request(
+                url, headers=self.get_conditional_headers(entry), session=session
+            )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if entry:
+                _logger.debug("Could not reach `%s`, using the cached config", url)
+                return entry["content"]
+            raise
+        if resp.status == 304 and entry:
+            return entry["content"]
+        resp.raise_for_status()
+        content = await resp.text()
+        self.set_entry(url, content, resp.headers)
+        return content
+
+    def revalidate(self, url: str, entry: Dict):
+        try:
+            self.fetch(url, entry)
+        except Exception as e:  # noqa
+            _logger.debug("Could not revalidate the cached config `%s`: %s", url, e)
+        finally:
+            with self._lock:
+                self._revalidations.pop(url, None)
+
+    def schedule_revalidation(self, url: str, entry: Dict) -> Future:
+        """
+        Revalidates the entry in the background,
+        returns the pending revalidation of the url if there's already one.
+        """
+        with self._lock:
+            future = self._revalidations.get(url)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_revalidations,
+                        thread_name_prefix="clipped-http-cache",
+                    )
+                # `revalidate` releases the url under the same lock, after this update
+                future = self._executor.submit(self.revalidate, url, entry)
+                self._revalidations[url] = future
+            return future
+
+    def lookup(self, url: str, immutable: bool = False) -> Tuple[Optional[Dict], bool]:
+        """
+        Returns the cached entry, if any,
+        and whether it can be served without fetching the document.
+
+        Stale entries are served, and revalidated in the background,
+        if `stale_while_revalidate` is set.
+        """
+        entry = self.get_entry(url)
+        if entry and (immutable or self.offline):
+            return entry, True
+        if self.offline:
+            raise self.schema_exception(
+                "Config `{}` is not available in the offline cache".format(url)
+            )
+        if entry and self.stale_while_revalidate:
+            self.schedule_revalidation(url, entry)
+            return entry, True
+        return entry, False
+
+    def get(
+        self, url: str, session: Optional[Session] = None, immutable: bool = False
+    ) -> str:
+        entry, is_servable = self.lookup(url, immutable=immutable)
+        if entry and is_servable:
+            return entry["content"]
+        return self.fetch(url, entry, session=session)
+
+    async def aget(
+        self, url: str, session: Optional[Any] = None, immutable: bool = False
+    ) -> str:
+        entry, is_servable = self.lookup(url, immutable=immutable)
+        if entry and is_servable:
+            return entry["content"]
+        return await self.afetch(url, entry, session=session)
 
 
 class ConfigSpec:
     _SCHEMA_EXCEPTION = SchemaError
+    _FILE_CACHE: Optional[ConfigFileCache] = None
+    _HTTP_CACHE: Optional[ConfigHttpCache] = None
 
     def __init__(
-        self, value: Any, config_type: str = None, check_if_exists: bool = True
+        self,
+        value: Any,
+        config_type: Optional[str] = None,
+        check_if_exists: bool = True,
     ):
         self.value = value
         self.config_type = config_type
         self.check_if_exists = check_if_exists
 
     @classmethod
-    def get_from(cls, value: Any, config_type: str = None) -> "ConfigSpec":
+    def get_from(cls, value: Any, config_type: Optional[str] = None) -> "ConfigSpec":
         if isinstance(value, ConfigSpec):
             return value
 
@@ -41,7 +325,14 @@ class ConfigSpec:
                 "received {} instead".format(type(self.value))
             )
 
-    def read(self) -> Dict:
+    def get_source(self, index: int) -> Tuple[int, Any]:
+        """Returns the `(index, source)` recorded in the provenance index."""
+        return index, self.value if isinstance(self.value, str) else None
+
+    def is_remote(self) -> bool:
+        return self.config_type in ("url", "hub") and isinstance(self.value, str)
+
+    def read(self, session: Optional[Session] = None) -> Dict:
         if isinstance(self.value, Mapping):
             return self.value
 
@@ -59,45 +350,217 @@ class ConfigSpec:
         # try reading a stream of yaml or json
         if not self.config_type or self.config_type in (".json", ".yml", ".yaml"):
             try:
-                return self.read_from_stream(self.value)
+                return self.read_from_stream(self.value, self.config_type)
             except (ScannerError, ParserError):
                 raise self._SCHEMA_EXCEPTION(
                     "Received an invalid yaml stream: `{}`".format(self.value)
                 )
 
         if self.config_type == "url":
-            return self.read_from_url(self.value)
+            return self.read_from_url(self.value, session=session)
 
         if self.config_type == "hub":
             public_hub = self.get_public_registry()
             if public_hub:
-                return self.read_from_public_hub(self.value, public_hub)
+                return self.read_from_public_hub(
+                    self.value, public_hub, session=session
+                )
             return self.read_from_custom_hub(self.value)
 
         raise self._SCHEMA_EXCEPTION(
             "Received an invalid configuration: `{}`".format(self.value)
         )
 
+    async def aread(self, session: Optional[Any] = None) -> Dict:
+        """
+        An async version of `read`, remote values are fetched with an async HTTP client,
+        other values are read with `read`.
+        """
+        if not self.is_remote() or os.path.isfile(self.value):
+            return self.read()
+
+        if self.config_type == "url":
+            return await self.aread_from_url(self.value, session=session)
+
+        public_hub = self.get_public_registry()
+        if public_hub:
+            return await self.aread_from_public_hub(
+                self.value, public_hub, session=session
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.read_from_custom_hub, self.value)
+
+    def timed_read(self, session: Optional[Session] = None) -> Tuple[Dict, float]:
+        """Returns the result of `read` and its duration in seconds."""
+        start = time.monotonic()
+        value = self.read(session=session)
+        duration = time.monotonic() - start
+        _logger.debug("Read config value `%s` in %.3fs", self.value, duration)
+        return value, duration
+
+    async def timed_aread(self, session: Optional[Any] = None) -> Tuple[Dict, float]:
+        """Returns the result of `aread` and its duration in seconds."""
+        start = time.monotonic()
+        value = await self.aread(session=session)
+        duration = time.monotonic() - start
+        _logger.debug("Read config value `%s` in %.3fs", self.value, duration)
+        return value, duration
+
+    @classmethod
+    def read_remote_values(
+        cls, config_values: List["ConfigSpec"], max_workers: Optional[int] = None
+    ) -> Dict[int, Future]:
+        """
+        Fetches the remote config values concurrently, returns futures by index.
+
+        Requests reuse the shared sessions of `clipped.utils.requests.get_session`.
+        """
+        remote_indices = [i for i, v in enumerate(config_values) if v.is_remote()]
+        if not remote_indices:
+            return {}
+
+        max_workers = max_workers or min(len(remote_indices), get_pool_workers())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                i: executor.submit(config_values[i].timed_read) for i in remote_indices
+            }
+        return futures
+
     @classmethod
-    def read_from(cls, config_values: Any, config_type: str = None) -> Dict:
+    def read_from(
+        cls,
+        config_values: Any,
+        config_type: Optional[str] = None,
+        concurrent: bool = False,
+        max_workers: Optional[int] = None,
+        timings: Optional[List[Tuple[Any, float]]] = None,
+        immutable: bool = False,
+        provenance: Optional[Dict[Tuple, Tuple[int, Any]]] = None,
+    ) -> Dict:
         """
         Reads an ordered list of configuration values and
         deep merge the values in reverse order.
+
+        If `concurrent` is set, remote values (`url` and `hub`) are fetched
+        in parallel before merging, the merge order is preserved.
+        If a `timings` list is provided, the duration of each read is appended to it.
+        If `immutable` is set, the values are merged with `deep_merge`, sharing
+        the subtrees that are not overridden instead of copying them.
+        If a `provenance` dict is provided, it's filled during the merge with the
+        `(index, source)` of the config value that set each key path,
+        see `clipped.utils.dicts.get_provenance`.
+        """
+        config_values = cls.get_config_values(config_values, config_type=config_type)
+        remote_results = (
+            cls.read_remote_values(config_values, max_workers=max_workers)
+            if concurrent
+            else {}
+        )
+        return cls.merge_values(
+            config_values,
+            remote_results,
+            timings=timings,
+            immutable=immutable,
+            provenance=provenance,
+        )
+
+    @classmethod
+    async def aread_from(
+        cls,
+        config_values: Any,
+        config_type: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timings: Optional[List[Tuple[Any, float]]] = None,
+        session: Optional[Any] = None,
+        immutable: bool = False,
+        provenance: Optional[Dict[Tuple, Tuple[int, Any]]] = None,
+    ) -> Dict:
+        """
+        An async version of `read_from`, remote values (`url` and `hub`) are fetched
+        concurrently, with at most `max_concurrency` requests in flight,
+        before merging the values in order.
+
+        If no session is provided, the requests share a session
+        that is closed once the values are fetched.
         """
+        config_values = cls.get_config_values(config_values, config_type=config_type)
+        semaphore = asyncio.Semaphore(max_concurrency or get_pool_workers())
+        remote_indices = [i for i, v in enumerate(config_values) if v.is_remote()]
+
+        async def _aread(config_value: "ConfigSpec", session: Optional[Any]):
+            async with semaphore:
+                return await config_value.timed_aread(session=session)
+
+        async def _aread_remote_values(session: Optional[Any]) -> List:
+            return await asyncio.gather(
+                *[_aread(config_values[i], session) for i in remote_indices],
+                return_exceptions=True,
+            )
+
+        if session is None and remote_indices:
+            from clipped.utils.async_requests import create_async_session
+
+            async with create_async_session() as session:
+                results = await _aread_remote_values(session)
+        else:
+            results = await _aread_remote_values(session)
+        return cls.merge_values(
+            config_values,
+            dict(zip(remote_indices, results)),
+            timings=timings,
+            immutable=immutable,
+            provenance=provenance,
+        )
+
+    @classmethod
+    def get_config_values(
+        cls, config_values: Any, config_type: Optional[str] = None
+    ) -> List["ConfigSpec"]:
         if not config_values:
             raise cls._SCHEMA_EXCEPTION(
                 "Cannot read config_value: `{}`".format(config_values)
             )
 
-        config_values = to_list(config_values, check_none=True)
+        return [
+            cls.get_from(value=config_value, config_type=config_type)
+            for config_value in to_list(config_values, check_none=True)
+        ]
 
-        config = {}
-        for config_value in config_values:
-            config_value = cls.get_from(value=config_value, config_type=config_type)
+    @classmethod
+    def merge_values(
+        cls,
+        config_values: List["ConfigSpec"],
+        remote_results: Dict[int, Any],
+        timings: Optional[List[Tuple[Any, float]]] = None,
+        immutable: bool = False,
+        provenance: Optional[Dict[Tuple, Tuple[int, Any]]] = None,
+    ) -> Dict:
+        """
+        Deep merges the config values in order, using the results already fetched
+        by index, i.e. futures or `(value, duration)` pairs of `timed_read`, or exceptions.
+        """
+        merge_fct = deep_merge if immutable else deep_update
+        config: Dict = {}
+        for i, config_value in enumerate(config_values):
             config_value.check_type()
-            config_results = config_value.read()
+            if i in remote_results:
+                config_results = remote_results[i]
+                if isinstance(config_results, Future):
+                    config_results = config_results.result()
+                elif isinstance(config_results, BaseException):
+                    raise config_results
+                config_results, duration = config_results
+            else:
+                config_results, duration = config_value.timed_read()
+            if timings is not None:
+                timings.append((config_value.value, duration))
             if config_results and isinstance(config_results, Mapping):
-                config = deep_update(config, config_results)
+                config = merge_fct(
+                    config,
+                    config_results,
+                    provenance=provenance,
+                    source=config_value.get_source(i),
+                )
             elif config_value.check_if_exists:
                 raise cls._SCHEMA_EXCEPTION(
                     "Cannot read config_value: `{}`".format(config_value.value)
@@ -106,19 +569,115 @@ class ConfigSpec:
         return config
 
     @classmethod
-    def read_from_url(cls, url: str) -> Dict:
+    def enable_http_cache(
+        cls,
+        path: Optional[str] = None,
+        offline: bool = False,
+        stale_while_revalidate: bool = False,
+    ) -> ConfigHttpCache:
+        """
+        Caches the remote config documents under `path`,
+        the default is the clipped temp path, see also `ConfigManager.enable_http_cache`.
+        """
+        path = path or os.path.join(get_temp_path(".clipped"), "http_cache")
+        cls._HTTP_CACHE = ConfigHttpCache(
+            path=path,
+            offline=offline,
+            stale_while_revalidate=stale_while_revalidate,
+            schema_exception=cls._SCHEMA_EXCEPTION,
+        )
+        return cls._HTTP_CACHE
+
+    @classmethod
+    def disable_http_cache(cls):
+        cls._HTTP_CACHE = None
+
+    @classmethod
+    def read_from_url(
+        cls, url: str, session: Optional[Session] = None, immutable: bool = False
+    ) -> Dict:
+        if cls._HTTP_CACHE is not None:
+            content = cls._HTTP_CACHE.get(url, session=session, immutable=immutable)
+            return cls.read_from_stream(content)
+
         from clipped.utils.requests import safe_request
 
-        resp = safe_request(url)
+        resp = safe_request(url, session=session)
         resp.raise_for_status()
         return cls.read_from_stream(resp.content.decode())
 
+    @classmethod
+    async def aread_from_url(
+        cls, url: str, session: Optional[Any] = None, immutable: bool = False
+    ) -> Dict:
+        if cls._HTTP_CACHE is not None:
+            content = await cls._HTTP_CACHE.aget(
+                url, session=session, immutable=immutable
+            )
+            return cls.read_from_stream(content)
+
+        from clipped.utils.async_requests import async_safe_request
+
+        resp = await async_safe_request(url, session=session)
+        resp.raise_for_status()
+        return cls.read_from_stream(await resp.text())
+
+    @classmethod
+    def iter_documents(
+        cls, value: Any, config_type: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily yields the mappings of a multi-document yaml (`---` separated)
+        or a json-lines (`.jsonl`, `.ndjson`) file, stream, or file object.
+        """
+        if isinstance(value, str) and os.path.isfile(value):
+            _, ext = os.path.splitext(value)
+            with open(value) as f:
+                yield from cls._iter_documents(f, config_type or ext)
+        else:
+            yield from cls._iter_documents(value, config_type)
+
+    @classmethod
+    def _iter_documents(cls, stream: Any, config_type: Optional[str] = None):
+        if config_type in (".jsonl", ".ndjson"):
+            lines = stream.splitlines() if isinstance(stream, str) else stream
+            documents: Iterator[Any] = (
+                cls.read_from_json(line, is_stream=True)
+                for line in lines
+                if line.strip()
+            )
+        else:
+            documents = safe_load_all(stream)
+
+        try:
+            for document in documents:
+                if document is None:
+                    continue
+                if not isinstance(document, Mapping):
+                    raise cls._SCHEMA_EXCEPTION(
+                        "Expects a Mapping for each document, "
+                        "received {} instead".format(type(document))
+                    )
+                yield document
+        except (ScannerError, ParserError) as e:
+            raise cls._SCHEMA_EXCEPTION(
+                "Received non valid yaml documents.\nYaml error %s" % e
+            ) from e
+
+    @classmethod
+    def read_documents(cls, value: Any, config_type: Optional[str] = None) -> Dict:
+        """Deep merges the documents of `value` one at a time, in order."""
+        config: Dict = {}
+        for document in cls.iter_documents(value, config_type=config_type):
+            config = deep_update(config, document)
+        return config
+
     @classmethod
     def get_public_registry(cls) -> str:
         return ""
 
     @classmethod
-    def read_from_public_hub(cls, hub: str, public_hub: str) -> Dict:
+    def get_public_hub_url(cls, hub: str, public_hub: str) -> Tuple[str, str]:
         hub_values = hub.split(":")
         if len(hub_values) > 2:
             raise cls._SCHEMA_EXCEPTION(
@@ -129,19 +688,46 @@ class ConfigSpec:
         else:
             hub_name, version = hub_values[0], "latest"
         version = version or "latest"
-        url = "{}/{}/{}.yaml".format(public_hub, hub_name, version)
+        return "{}/{}/{}.yaml".format(public_hub, hub_name, version), version
+
+    @classmethod
+    def get_public_hub_error(cls, hub: str, status_code: int, error: Exception):
+        if status_code == 404:
+            return cls._SCHEMA_EXCEPTION(
+                "Config `{}` was not found, "
+                "please check that the name and tag are valid".format(hub)
+            )
+        return cls._SCHEMA_EXCEPTION(
+            "Config `{}` could not be fetched, "
+            "an error was encountered {}".format(hub, error)
+        )
+
+    @classmethod
+    def read_from_public_hub(
+        cls, hub: str, public_hub: str, session: Optional[Session] = None
+    ) -> Dict:
+        url, version = cls.get_public_hub_url(hub, public_hub)
         try:
-            return cls.read_from_url(url)
+            # Versioned hub components are immutable
+            return cls.read_from_url(
+                url, session=session, immutable=version != "latest"
+            )
         except HTTPError as e:
-            if e.response.status_code == 404:
-                raise cls._SCHEMA_EXCEPTION(
-                    "Config `{}` was not found, "
-                    "please check that the name and tag are valid".format(hub)
-                )
-            raise cls._SCHEMA_EXCEPTION(
-                "Config `{}` could not be fetched, "
-                "an error was encountered {}".format(hub, e)
+            raise cls.get_public_hub_error(hub, e.response.status_code, e)
+
+    @classmethod
+    async def aread_from_public_hub(
+        cls, hub: str, public_hub: str, session: Optional[Any] = None
+    ) -> Dict:
+        from clipped.utils.async_requests import aiohttp
+
+        url, version = cls.get_public_hub_url(hub, public_hub)
+        try:
+            return await cls.aread_from_url(
+                url, session=session, immutable=version != "latest"
             )
+        except aiohttp.ClientResponseError as e:
+            raise cls.get_public_hub_error(hub, e.status, e)
 
     @classmethod
     def read_from_custom_hub(cls, hub: str) -> Dict:
@@ -150,8 +736,28 @@ class ConfigSpec:
             "please set a valid registry to load the configs from".format(hub)
         )
 
+    @staticmethod
+    def is_json_stream(stream: Any, config_type: Optional[str] = None) -> bool:
+        if config_type == ".json":
+            return True
+        if isinstance(stream, str):
+            return JSON_STREAM_REGEX.match(stream) is not None
+        if isinstance(stream, bytes):
+            return JSON_BYTES_STREAM_REGEX.match(stream) is not None
+        return False
+
     @classmethod
-    def read_from_stream(cls, stream) -> Dict:
+    def read_from_stream(cls, stream, config_type: Optional[str] = None) -> Dict:
+        if isinstance(stream, str) and stream.startswith("\ufeff"):
+            stream = stream[1:]
+        elif isinstance(stream, bytes) and stream.startswith(b"\xef\xbb\xbf"):
+            stream = stream[3:]
+        if cls.is_json_stream(stream, config_type):
+            try:
+                return orjson_loads(stream)
+            except ValueError:
+                # Not valid json, e.g. a yaml flow mapping `{x: y}`
+                pass
         results = cls.read_from_yml(stream, is_stream=True)
         if not results:
             results = cls.read_from_json(stream, is_stream=True)
@@ -207,8 +813,45 @@ class ConfigSpec:
         module = cls.import_py_module(f_path, module_name)
         return getattr(module, f_module)
 
+    @classmethod
+    def enable_file_cache(
+        cls, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024
+    ) -> ConfigFileCache:
+        cls._FILE_CACHE = ConfigFileCache(max_entries=max_entries, max_bytes=max_bytes)
+        return cls._FILE_CACHE
+
+    @classmethod
+    def disable_file_cache(cls):
+        cls._FILE_CACHE = None
+
     @classmethod
     def read_from_file(cls, f_path, file_type):
+        _, ext = os.path.splitext(f_path)
+        if cls._FILE_CACHE is not None and not (ext == ".py" or file_type == ".py"):
+            return cls._FILE_CACHE.get(f_path, file_type, cls._read_from_opened_file)
+        return cls._read_from_file(f_path, file_type)
+
+    @classmethod
+    def _read_from_opened_file(cls, f: TextIO, file_type: Optional[str]) -> Any:
+        _, ext = os.path.splitext(f.name)
+        if ext in (".yml", ".yaml") or file_type in (None, ".yml", ".yaml"):
+            try:
+                return safe_load(f)
+            except (ScannerError, ParserError) as e:
+                raise cls._SCHEMA_EXCEPTION(
+                    "Received non valid yaml: `%s`.\nYaml error %s" % (f.name, e)
+                ) from e
+        elif ext == ".json" or file_type == ".json":
+            try:
+                return orjson_loads(f.read())
+            except ValueError as e:
+                raise cls._SCHEMA_EXCEPTION(
+                    "Received non valid json: `%s`.\nJson error %s" % (f.name, e)
+                ) from e
+        return cls._read_from_file(f.name, file_type)
+
+    @classmethod
+    def _read_from_file(cls, f_path, file_type):
         _, ext = os.path.splitext(f_path)
         if ext in (".yml", ".yaml") or file_type in (None, ".yml", ".yaml"):
             return cls.read_from_yml(f_path)
@@ -227,9 +870,9 @@ class ConfigSpec:
     def read_from_yml(cls, f_path, is_stream=False):
         try:
             if is_stream:
-                return yaml.safe_load(f_path)
+                return safe_load(f_path)
             with open(f_path) as f:
-                return yaml.safe_load(f)
+                return safe_load(f)
         except (ScannerError, ParserError) as e:
             raise cls._SCHEMA_EXCEPTION(
                 "Received non valid yaml: `%s`.\n" "Yaml error %s" % (f_path, e)
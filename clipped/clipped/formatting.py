@@ -1,5 +1,4 @@
 import sys
-import yaml
 
 from typing import Dict, List, Optional, Union
 
@@ -27,6 +26,7 @@ from clipped.utils.humanize import humanize_attrs
 from clipped.utils.json import orjson_dumps, orjson_loads, orjson_pprint_option
 from clipped.utils.lists import to_list
 from clipped.utils.units import to_unit_memory
+from clipped.utils.yaml import safe_dump, safe_load
 
 
 class Printer:
@@ -84,8 +84,8 @@ class Printer:
     @classmethod
     def print_yaml(cls, value: any):
         if isinstance(value, str):
-            value = yaml.safe_load(value)
-        value = yaml.safe_dump(value, sort_keys=True, indent=2)
+            value = safe_load(value)
+        value = safe_dump(value, sort_keys=True, indent=2)
         syntax = Syntax(value, "yaml", theme="dracula", line_numbers=False)
         cls.console.print(syntax)
 
@@ -0,0 +1,160 @@
+import itertools
+
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from clipped.utils.csv import get_fieldnames
+
+ARROW_BATCH_SIZE = 10000
+
+
+def _get_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("This function depends on pyarrow.")
+    return pa
+
+
+def _get_column(rows: List[Dict], key: str, to_str: bool = False) -> List:
+    if to_str:
+        return [None if row.get(key) is None else str(row[key]) for row in rows]
+    return [row.get(key) for row in rows]
+
+
+def _get_record_batch(
+    pa: Any,
+    rows: List[Dict],
+    fieldnames: List[str],
+    schema: Any,
+    str_fieldnames: FrozenSet[str] = frozenset(),
+):
+    return pa.RecordBatch.from_pydict(
+        {key: _get_column(rows, key, key in str_fieldnames) for key in fieldnames},
+        schema=schema,
+    )
+
+
+def _promote_null_fields(pa: Any, batch: Any) -> Tuple[Any, FrozenSet[str]]:
+    """
+    Promotes the null typed columns of the batch to strings,
+    a null type cannot hold the values of the following batches.
+    """
+    schema = batch.schema
+    str_fieldnames = frozenset(f.name for f in schema if pa.types.is_null(f.type))
+    if not str_fieldnames:
+        return batch, str_fieldnames
+    schema = pa.schema(
+        [f.with_type(pa.string()) if f.name in str_fieldnames else f for f in schema],
+        metadata=schema.metadata,
+    )
+    columns = [c.cast(f.type) for c, f in zip(batch.columns, schema)]
+    return pa.RecordBatch.from_arrays(columns, schema=schema), str_fieldnames
+
+
+def iter_record_batches(
+    objects: Iterable[Dict],
+    schema: Optional[Any] = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+    infer_schema_batches: int = 1,
+) -> Tuple[Any, Iterator[Any]]:
+    """
+    Converts an iterable of dicts, e.g. the rows of `iter_dicts_to_csv`,
+    to pyarrow record batches of at most `batch_size` rows,
+    only one batch is kept in memory at a time.
+
+    If `schema` is not provided, it's inferred from the rows of
+    the first `infer_schema_batches` batches, keys that are not part of the schema
+    are ignored, and columns with only null values in those batches are stored
+    as strings, with the values of the following batches converted with `str`.
+    Returns the schema and the iterator of the record batches.
+    """
+    pa = _get_pyarrow()
+    objects = iter(objects)
+    rows = list(itertools.islice(objects, batch_size * max(infer_schema_batches, 1)))
+    if schema is None:
+        # The rows used to infer the schema are converted once, and sliced without copies
+        first_batch = _get_record_batch(pa, rows, get_fieldnames(rows), schema=None)
+        first_batch, str_fieldnames = _promote_null_fields(pa, first_batch)
+        schema = first_batch.schema
+        rows.clear()
+    else:
+        first_batch = None
+        str_fieldnames = frozenset()
+    fieldnames = schema.names
+
+    def get_batches():
+        nonlocal first_batch
+        if first_batch is not None:
+            for i in range(0, first_batch.num_rows, batch_size):
+                yield first_batch.slice(i, batch_size)
+            first_batch = None
+        for i in range(0, len(rows), batch_size):
+            yield _get_record_batch(
+                pa, rows[i : i + batch_size], fieldnames, schema, str_fieldnames
+            )
+        rows.clear()
+        while True:
+            chunk = list(itertools.islice(objects, batch_size))
+            if not chunk:
+                return
+            yield _get_record_batch(pa, chunk, fieldnames, schema, str_fieldnames)
+
+    return schema, get_batches()
+
+
+def write_parquet(
+    objects: Iterable[Dict],
+    filename: str,
+    schema: Optional[Any] = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+    infer_schema_batches: int = 1,
+    **kwargs,
+) -> int:
+    """
+    Writes an iterable of dicts to a Parquet file, one row group per batch,
+    and returns the number of rows written, see `iter_record_batches`.
+
+    Extra `kwargs` are passed to `pyarrow.parquet.ParquetWriter`, e.g. `compression`.
+    """
+    pa = _get_pyarrow()
+    import pyarrow.parquet as pq
+
+    schema, batches = iter_record_batches(
+        objects,
+        schema=schema,
+        batch_size=batch_size,
+        infer_schema_batches=infer_schema_batches,
+    )
+    num_rows = 0
+    with pq.ParquetWriter(filename, schema, **kwargs) as writer:
+        for batch in batches:
+            writer.write_table(pa.Table.from_batches([batch], schema=schema))
+            num_rows += batch.num_rows
+    return num_rows
+
+
+def write_arrow(
+    objects: Iterable[Dict],
+    filename: str,
+    schema: Optional[Any] = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+    infer_schema_batches: int = 1,
+) -> int:
+    """
+    Writes an iterable of dicts to an Arrow IPC (Feather v2) file
+    and returns the number of rows written, see `iter_record_batches`.
+    """
+    pa = _get_pyarrow()
+
+    schema, batches = iter_record_batches(
+        objects,
+        schema=schema,
+        batch_size=batch_size,
+        infer_schema_batches=infer_schema_batches,
+    )
+    num_rows = 0
+    with pa.ipc.new_file(filename, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            num_rows += batch.num_rows
+    return num_rows
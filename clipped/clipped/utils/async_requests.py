@@ -0,0 +1,153 @@
+import os
+import ssl
+
+from typing import Any, Dict, Optional, Union
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError("This module depends on aiohttp.")
+
+from clipped.utils.requests import POOL_MAXSIZE
+
+
+# Same session attributes as `clipped.utils.requests.create_session`,
+# `stream` is not supported since the body is always read
+SESSION_ATTRS = frozenset(
+    ["proxies", "proxy", "verify", "verify_ssl", "cert", "max_redirects", "trust_env"]
+)
+
+
+def get_ssl(
+    verify: Union[bool, str] = True, cert: Optional[Union[str, tuple]] = None
+) -> Union[bool, ssl.SSLContext]:
+    """
+    Converts the `verify` and `cert` options of `requests` to an aiohttp `ssl` option,
+    `verify` can be a CA bundle file or directory,
+    and `cert` a client certificate file or a `(cert, key)` tuple.
+    """
+    if cert is None and isinstance(verify, bool):
+        return verify
+    if isinstance(verify, str):
+        is_dir = os.path.isdir(verify)
+        context = ssl.create_default_context(
+            cafile=None if is_dir else verify, capath=verify if is_dir else None
+        )
+    else:
+        context = ssl.create_default_context()
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    if cert is not None:
+        certfile, keyfile = (cert, None) if isinstance(cert, str) else cert
+        context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+def get_request_kwargs(url: str, session_attrs: Optional[Dict] = None) -> Dict:
+    """
+    Returns the aiohttp request options for the `session_attrs`
+    of `clipped.utils.requests.create_session`, raises on unsupported attributes.
+    """
+    session_attrs = session_attrs or {}
+    unsupported = set(session_attrs) - SESSION_ATTRS
+    if unsupported:
+        raise ValueError(
+            "Session attributes {} are not supported by async requests.".format(
+                sorted(unsupported)
+            )
+        )
+
+    kwargs: Dict[str, Any] = {}
+    verify = session_attrs.get("verify", session_attrs.get("verify_ssl", True))
+    ssl_option = get_ssl(verify, session_attrs.get("cert"))
+    if ssl_option is not True:
+        kwargs["ssl"] = ssl_option
+    proxy = session_attrs.get("proxies") or session_attrs.get("proxy")
+    if isinstance(proxy, dict):
+        proxy = proxy.get(url.split(":", 1)[0])
+    if proxy:
+        kwargs["proxy"] = proxy
+    if "max_redirects" in session_attrs:
+        kwargs["max_redirects"] = session_attrs["max_redirects"]
+    return kwargs
+
+
+def create_async_session(
+    session_attrs: Optional[Dict] = None,
+    limit: Optional[int] = None,
+    limit_per_host: Optional[int] = None,
+) -> aiohttp.ClientSession:
+    """
+    Creates a session that does not store cookies, to be used with `async with`
+    so that its connections are released with the event loop.
+
+    Similar to `requests`, the environment (proxies, netrc) is used
+    unless `trust_env` is set to `False`, the other `session_attrs`
+    are applied to each request, see `get_request_kwargs`.
+    """
+    session_attrs = session_attrs or {}
+    connector = aiohttp.TCPConnector(
+        limit=limit or POOL_MAXSIZE, limit_per_host=limit_per_host or 0
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        trust_env=session_attrs.get("trust_env", True),
+        cookie_jar=aiohttp.DummyCookieJar(),
+    )
+
+
+async def _request(
+    session: aiohttp.ClientSession, method: str, url: str, **kwargs
+) -> aiohttp.ClientResponse:
+    async with session.request(method=method, url=url, **kwargs) as response:
+        await response.read()
+    return response
+
+
+async def async_safe_request(
+    url: str,
+    method: Optional[str] = None,
+    params: Optional[Dict] = None,
+    data: Optional[Dict] = None,
+    json: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    allow_redirects: bool = False,
+    timeout: float = 30,
+    verify_ssl: bool = True,
+    session: Optional[aiohttp.ClientSession] = None,
+    session_attrs: Optional[Dict] = None,
+) -> aiohttp.ClientResponse:
+    """
+    An async version of `clipped.utils.requests.safe_request`.
+
+    If no session is provided, a session is created and closed for the request,
+    pass a session created with `create_async_session` to reuse connections.
+    The body is read before returning the response, and is available with
+    `await response.text()` or `await response.json()`.
+    """
+    kwargs = get_request_kwargs(url, session_attrs)
+
+    if json:
+        kwargs["json"] = json
+
+    if data:
+        kwargs["data"] = data
+
+    if params:
+        kwargs["params"] = params
+
+    if headers:
+        kwargs["headers"] = headers
+
+    if not verify_ssl:
+        kwargs["ssl"] = False
+
+    method = method or ("POST" if (data or json) else "GET")
+    kwargs["allow_redirects"] = allow_redirects
+    kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+    if session is None:
+        async with create_async_session(session_attrs) as session:
+            return await _request(session, method, url, **kwargs)
+    return await _request(session, method, url, **kwargs)
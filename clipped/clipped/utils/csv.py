@@ -1,24 +1,97 @@
-import sys
+import csv
+import gzip
+import itertools
+import logging
 
-from typing import Dict
+from typing import Dict, Iterable, List, Literal, Optional, Set
 
+_logger = logging.getLogger("clipped.utils.csv")
 
-def write_csv(objects: Dict, filename: str):
-    try:
-        import pandas as pd
+CSV_CHUNK_SIZE = 1000
 
-        df = pd.DataFrame(objects)
-        df.to_csv(filename)
-    except ImportError:
-        pass
 
-    try:
-        import csv
+def _open_csv_file(filename: str, compress: bool):
+    if compress:
+        return gzip.open(filename, "wt", encoding="utf8", newline="")
+    return open(filename, "w", encoding="utf8", newline="")
 
-        with open(filename, "w", encoding="utf8", newline="") as output_file:
-            writer = csv.DictWriter(output_file, fieldnames=objects[0].keys())
-            writer.writeheader()
-            writer.writerows(objects)
-    except ImportError:
-        print("`pandas` or `csv` module are required to use `write_csv` function.")
-        sys.exit(1)
+
+def get_fieldnames(rows: List[Dict]) -> List[str]:
+    """Returns the keys of all the rows, in the order they are first seen."""
+    # Dicts are used as insertion ordered sets
+    fieldnames = {}
+    for row in rows:
+        fieldnames.update(dict.fromkeys(row))
+    return list(fieldnames)
+
+
+def write_csv_stream(
+    objects: Iterable[Dict],
+    filename: str,
+    fieldnames: Optional[List[str]] = None,
+    delimiter: Optional[str] = None,
+    compress: Optional[bool] = None,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    extrasaction: Literal["raise", "ignore"] = "ignore",
+) -> int:
+    """
+    Writes an iterable of dicts, e.g. a generator or a paginated API iterator,
+    to a CSV file in chunks of `chunk_size` rows, and returns the number of rows written.
+
+    If `fieldnames` is not provided, the columns are discovered from the first chunk.
+    Keys that are not part of the columns are left out, with a warning if the columns
+    were discovered, set `extrasaction` to `raise` to raise a `ValueError` instead.
+    The file is written as TSV if the filename ends with `.tsv` or `.tsv.gz`,
+    and is compressed on the fly with gzip if the filename ends with `.gz`,
+    `delimiter` and `compress` override these defaults.
+    """
+    compress = filename.endswith(".gz") if compress is None else compress
+    if delimiter is None:
+        suffix = filename[:-3] if filename.endswith(".gz") else filename
+        delimiter = "\t" if suffix.endswith(".tsv") else ","
+
+    objects = iter(objects)
+    chunk = list(itertools.islice(objects, chunk_size))
+    warn_extra_keys = fieldnames is None and extrasaction == "ignore"
+    if fieldnames is None:
+        fieldnames = get_fieldnames(chunk)
+    known_keys: Set[str] = set(fieldnames)
+
+    num_rows = 0
+    with _open_csv_file(filename, compress=compress) as output_file:
+        if not fieldnames:
+            return num_rows
+        writer = csv.DictWriter(
+            output_file,
+            fieldnames=fieldnames,
+            delimiter=delimiter,
+            extrasaction=extrasaction,
+        )
+        writer.writeheader()
+        while chunk:
+            if warn_extra_keys:
+                extra_keys = set(get_fieldnames(chunk)) - known_keys
+                if extra_keys:
+                    _logger.warning(
+                        "Keys %s not found in the first %s rows "
+                        "are not written to `%s`.",
+                        sorted(extra_keys),
+                        chunk_size,
+                        filename,
+                    )
+                    known_keys |= extra_keys
+            writer.writerows(chunk)
+            num_rows += len(chunk)
+            chunk = list(itertools.islice(objects, chunk_size))
+
+    return num_rows
+
+
+def write_csv(objects: Iterable[Dict], filename: str):
+    """
+    Writes the dicts to a CSV file with `write_csv_stream`.
+
+    The columns are discovered from the first `CSV_CHUNK_SIZE` rows,
+    keys that only appear in later rows are left out with a warning.
+    """
+    write_csv_stream(objects, filename)
@@ -1,75 +1,344 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from clipped.utils.humanize import humanize_attrs
 
 
-def deep_update(config: Dict, override_config: Dict):
-    for k, v in override_config.items():
-        if isinstance(v, dict):
-            k_config = config.get(k, {})
-            if isinstance(k_config, dict):
-                v_config = deep_update(k_config, v)
-                config[k] = v_config
-            else:
-                config[k] = v
+_MISSING = object()
+
+
+def _record_provenance(provenance: Dict, prefix: Tuple, value: Any, source: Any):
+    stack = [(prefix, value)]
+    while stack:
+        prefix, value = stack.pop()
+        if isinstance(value, dict) and value:
+            for k, v in value.items():
+                stack.append((prefix + (k,), v))
+        else:
+            provenance[prefix] = source
+
+
+def _drop_provenance(provenance: Dict, prefix: Tuple, value: Any):
+    stack = [(prefix, value)]
+    while stack:
+        prefix, value = stack.pop()
+        if isinstance(value, dict) and value:
+            for k, v in value.items():
+                stack.append((prefix + (k,), v))
         else:
-            config[k] = override_config[k]
+            provenance.pop(prefix, None)
+
+
+def _merge_lists(current_value: List, value: List, list_strategy: str) -> List:
+    if list_strategy == "post_merge":
+        return current_value + [i for i in value if i not in current_value]
+    if list_strategy == "pre_merge":
+        return value + [i for i in current_value if i not in value]
+    if list_strategy == "isnull":
+        return current_value
+    return value
+
+
+def _set_value(
+    config: Dict,
+    k: Any,
+    current_value: Any,
+    v: Any,
+    provenance: Optional[Dict],
+    source: Any,
+    prefix: Tuple,
+    list_strategy: Optional[str],
+):
+    if list_strategy and isinstance(v, list) and isinstance(current_value, list):
+        v = _merge_lists(current_value, v, list_strategy)
+        if v is current_value:
+            return
+    if provenance is not None:
+        path = prefix + (k,)
+        if current_value is not _MISSING:
+            _drop_provenance(provenance, path, current_value)
+        _record_provenance(provenance, path, v, source)
+    config[k] = v
+
+
+def deep_update(
+    config: Dict,
+    override_config: Dict,
+    provenance: Optional[Dict] = None,
+    source: Any = None,
+    prefix: Tuple = (),
+    list_strategy: Optional[str] = None,
+):
+    """
+    Deep updates `config` in place with the values of `override_config`.
+
+    The merge is iterative, it does not hit the recursion limit with deeply nested values.
+    Lists are replaced unless a `list_strategy` is provided, one of the `PatchStrategy` values:
+        * `post_merge`: appends the new items to the current list.
+        * `pre_merge`: prepends the new items to the current list.
+        * `isnull`: keeps the current list.
+
+    If a `provenance` dict is provided, it's updated during the merge with the
+    `source` of every leaf key path set by `override_config`.
+    """
+    if provenance is None and list_strategy is None:
+        # Fast path, no key paths to track and no calls per value
+        fast_stack = [(config, override_config)]
+        while fast_stack:
+            current_config, current_override = fast_stack.pop()
+            for k, v in current_override.items():
+                if isinstance(v, dict):
+                    current_value = current_config.get(k, _MISSING)
+                    if current_value is _MISSING:
+                        current_value = current_config[k] = {}
+                    if isinstance(current_value, dict):
+                        fast_stack.append((current_value, v))
+                        continue
+                current_config[k] = v
+        return config
+
+    stack = [(config, override_config, prefix)]
+    while stack:
+        current_config, current_override, current_prefix = stack.pop()
+        for k, v in current_override.items():
+            current_value = current_config.get(k, _MISSING)
+            if isinstance(v, dict):
+                if current_value is _MISSING:
+                    if provenance is not None and not v:
+                        provenance[current_prefix + (k,)] = source
+                    current_value = current_config[k] = {}
+                if isinstance(current_value, dict):
+                    stack.append((current_value, v, current_prefix + (k,)))
+                    continue
+            _set_value(
+                current_config,
+                k,
+                current_value,
+                v,
+                provenance,
+                source,
+                current_prefix,
+                list_strategy,
+            )
     return config
 
 
+def deep_merge(
+    config: Dict,
+    override_config: Dict,
+    provenance: Optional[Dict] = None,
+    source: Any = None,
+    prefix: Tuple = (),
+    list_strategy: Optional[str] = None,
+) -> Dict:
+    """
+    A non-mutating version of `deep_update`, returns a new dict and never modifies the inputs.
+
+    Subtrees that are not modified by the merge are shared with the inputs instead of copied,
+    the result should therefore be treated as immutable.
+    """
+    result = dict(config)
+    if provenance is None and list_strategy is None:
+        fast_stack = [(result, override_config)]
+        while fast_stack:
+            current_result, current_override = fast_stack.pop()
+            for k, v in current_override.items():
+                if isinstance(v, dict):
+                    current_value = current_result.get(k)
+                    if isinstance(current_value, dict):
+                        current_value = current_result[k] = dict(current_value)
+                        fast_stack.append((current_value, v))
+                        continue
+                current_result[k] = v
+        return result
+
+    stack = [(result, override_config, prefix)]
+    while stack:
+        current_result, current_override, current_prefix = stack.pop()
+        for k, v in current_override.items():
+            current_value = current_result.get(k, _MISSING)
+            if isinstance(v, dict) and isinstance(current_value, dict):
+                current_value = current_result[k] = dict(current_value)
+                stack.append((current_value, v, current_prefix + (k,)))
+                continue
+            _set_value(
+                current_result,
+                k,
+                current_value,
+                v,
+                provenance,
+                source,
+                current_prefix,
+                list_strategy,
+            )
+    return result
+
+
+def get_provenance(provenance: Dict, key: Union[str, Tuple]) -> Any:
+    """
+    Returns the source recorded for a key path, e.g. `a.b.c` or `("a", "b", "c")`.
+
+    If the path points inside a value set as a whole (a list or a scalar),
+    the source of its closest recorded parent is returned.
+    """
+    path = tuple(key.split(".")) if isinstance(key, str) else tuple(key)
+    while path:
+        if path in provenance:
+            return provenance[path]
+        path = path[:-1]
+    return None
+
+
+def _get_prefixed_values(
+    col_values: Dict, column_prefix: str, prefixed_keys: Dict
+) -> Dict:
+    results = {}
+    for k, v in col_values.items():
+        prefixed_key = prefixed_keys.get(k)
+        if prefixed_key is None:
+            prefixed_key = prefixed_keys[k] = "{}.{}".format(column_prefix, k)
+        results[prefixed_key] = v
+    return results
+
+
+def _get_prefixed_columns(columns: List[str], prefixed_keys: Dict) -> Dict:
+    prefixed_columns = {}
+    for col in columns:
+        prefixed_columns.update(prefixed_keys.get(col, {}))
+    return prefixed_columns
+
+
+def _iter_flattened_values(
+    obj: Dict,
+    columns: List[str],
+    columns_prefix: Dict,
+    prefixed_keys: Dict,
+    pop: bool,
+):
+    col_values_list = [
+        (col, (obj.pop(col, None) if pop else obj.get(col)) or {}) for col in columns
+    ]
+    for col, col_values in col_values_list:
+        if col in columns_prefix:
+            col_values = _get_prefixed_values(
+                col_values,
+                columns_prefix[col],
+                prefixed_keys.setdefault(col, {}),
+            )
+        yield col_values
+
+
 def flatten_keys(
     objects: List[Dict], columns: List[str], columns_prefix: Optional[Dict] = None
 ) -> Tuple[List[Dict], Dict]:
-    # Extend run with params_keys
-    keys = set([])
+    """
+    Flattens the dict values of `columns` into each object, in place,
+    and sets the keys missing from an object to `None`.
+
+    If a column has a prefix in `columns_prefix`, its keys are prefixed, e.g. `metrics.loss`.
+    Returns the objects and the mapping of the original keys to the prefixed keys.
+    """
     columns_prefix = columns_prefix or {}
-    prefixed_columns = {}
+    prefixed_keys: Dict[str, Dict] = {}
+    # Dicts are used as insertion ordered sets
+    keys = {}
+    incomplete_objects = []
+    for obj in objects:
+        flattened_values = list(
+            _iter_flattened_values(
+                obj, columns, columns_prefix, prefixed_keys, pop=True
+            )
+        )
+        num_obj_keys = len(obj)
+        for col_values in flattened_values:
+            obj.update(col_values)
+            keys.update(col_values)
+        # The number of column keys set on the object, if it's lower than the number
+        # of keys seen so far (or later), the object needs to be completed
+        incomplete_objects.append((obj, len(obj) - num_obj_keys))
 
-    def process_objects():
-        results = {}
-        for k, v in col_values.items():
-            results["{}.{}".format(column_prefix, k)] = v
-            prefixed_columns[k] = "{}.{}".format(column_prefix, k)
-        return results
+    num_keys = len(keys)
+    for obj, num_obj_keys in incomplete_objects:
+        if num_obj_keys < num_keys:
+            for key in keys:
+                if key not in obj:
+                    obj[key] = None
 
-    for col in columns:
-        for obj in objects:
-            col_values = obj.pop(col, {}) or {}
-            if col in columns_prefix:
-                column_prefix = columns_prefix[col]
-                col_values = process_objects()
-            col_keys = col_values.keys()
-            keys |= set(col_keys)
-            obj.update(col_values)
+    return objects, _get_prefixed_columns(columns, prefixed_keys)
 
-    # Check that all obj have all metrics
-    # TODO: optimize this process
-    for obj in objects:
-        obj_keys = set(obj.keys())
-        for key in keys:
-            if key not in obj_keys:
-                obj[key] = None
 
-    return objects, prefixed_columns
+def flatten_keys_to_columns(
+    objects: List[Dict], columns: List[str], columns_prefix: Optional[Dict] = None
+) -> Tuple[Dict[str, List], Dict]:
+    """
+    A columnar version of `flatten_keys`, returns a list of values for every key,
+    with `None` for the objects missing the key, in a single pass
+    and without modifying the objects.
+    """
+    columns_prefix = columns_prefix or {}
+    columns_set = set(columns)
+    prefixed_keys: Dict[str, Dict] = {}
+    num_objects = len(objects)
+    data = {}
 
+    def get_values(key):
+        values = data[key] = [None] * num_objects
+        return values
 
-def list_dicts_to_tabulate(
-    list_dicts,
-    exclude_attrs=None,
-    include_attrs=None,
-    humanize_values=True,
-    upper_keys: bool = True,
-):
-    exclude_attrs = exclude_attrs or {}
-    results = []
+    for index, obj in enumerate(objects):
+        for k, v in obj.items():
+            if k not in columns_set:
+                (data.get(k) or get_values(k))[index] = v
+        for col_values in _iter_flattened_values(
+            obj, columns, columns_prefix, prefixed_keys, pop=False
+        ):
+            for k, v in col_values.items():
+                (data.get(k) or get_values(k))[index] = v
+
+    return data, _get_prefixed_columns(columns, prefixed_keys)
+
+
+def flatten_keys_to_dataframe(
+    objects: List[Dict], columns: List[str], columns_prefix: Optional[Dict] = None
+) -> Tuple[Any, Dict]:
+    """Similar to `flatten_keys_to_columns`, but returns a pandas `DataFrame`."""
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("This function depends on pandas.")
+
+    data, prefixed_columns = flatten_keys_to_columns(
+        objects, columns=columns, columns_prefix=columns_prefix
+    )
+    return pd.DataFrame(data, columns=list(data)), prefixed_columns
+
+
+def _get_attrs_filter(
+    exclude_attrs: Optional[Iterable[str]] = None,
+    include_attrs: Optional[Iterable[str]] = None,
+) -> Tuple[Optional[Set[str]], Set[str]]:
     if include_attrs:  # If include_attrs disable exclude_attrs
-        exclude_attrs = {}
+        return set(include_attrs), set()
+    return None, set(exclude_attrs or [])
+
+
+def iter_dicts_to_tabulate(
+    list_dicts: Iterable[Dict],
+    exclude_attrs: Optional[Iterable[str]] = None,
+    include_attrs: Optional[Iterable[str]] = None,
+    humanize_values: bool = True,
+    upper_keys: bool = True,
+) -> Iterator[Dict]:
+    """
+    A lazy version of `list_dicts_to_tabulate`, accepts any iterable,
+    e.g. a paginated API iterator, and yields the rows one by one.
+    """
+    include_attrs, exclude_attrs = _get_attrs_filter(exclude_attrs, include_attrs)
     for d_value in list_dicts:
         r_value = {}
         for k, v in d_value.items():
             if k in exclude_attrs:
                 continue
-            if include_attrs and k not in include_attrs:
+            if include_attrs is not None and k not in include_attrs:
                 continue
 
             if humanize_values:
@@ -78,30 +347,54 @@ def list_dicts_to_tabulate(
             if upper_keys:
                 k = k.upper()
             r_value[k] = v
-        results.append(r_value)
-    return results
+        yield r_value
 
 
-def list_dicts_to_csv(
+def list_dicts_to_tabulate(
     list_dicts,
     exclude_attrs=None,
     include_attrs=None,
+    humanize_values=True,
+    upper_keys: bool = True,
 ):
-    exclude_attrs = exclude_attrs or {}
-    results = []
-    if include_attrs:  # If include_attrs disable exclude_attrs
-        exclude_attrs = {}
+    return list(
+        iter_dicts_to_tabulate(
+            list_dicts,
+            exclude_attrs=exclude_attrs,
+            include_attrs=include_attrs,
+            humanize_values=humanize_values,
+            upper_keys=upper_keys,
+        )
+    )
+
+
+def iter_dicts_to_csv(
+    list_dicts: Iterable[Dict],
+    exclude_attrs: Optional[Iterable[str]] = None,
+    include_attrs: Optional[Iterable[str]] = None,
+) -> Iterator[Dict]:
+    """
+    A lazy version of `list_dicts_to_csv`, accepts any iterable,
+    e.g. a paginated API iterator, and yields the rows one by one.
+    """
+    include_attrs, exclude_attrs = _get_attrs_filter(exclude_attrs, include_attrs)
     for d_value in list_dicts:
-        result = {}
-        for k, v in d_value.items():
-            if k in exclude_attrs:
-                continue
-            if include_attrs and k not in include_attrs:
-                continue
-            result[k] = v
-        results.append(result)
+        if include_attrs is not None:
+            yield {k: v for k, v in d_value.items() if k in include_attrs}
+        else:
+            yield {k: v for k, v in d_value.items() if k not in exclude_attrs}
 
-    return results
+
+def list_dicts_to_csv(
+    list_dicts,
+    exclude_attrs=None,
+    include_attrs=None,
+):
+    return list(
+        iter_dicts_to_csv(
+            list_dicts, exclude_attrs=exclude_attrs, include_attrs=include_attrs
+        )
+    )
 
 
 def dict_to_tabulate(
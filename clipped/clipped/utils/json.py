@@ -11,14 +11,23 @@ def default_timedelta(obj):
     raise TypeError
 
 
+def orjson_dumps_bytes(
+    obj: Any,
+    *,
+    option: Optional[int] = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    default = default or default_timedelta
+    return orjson.dumps(obj, default=default, option=option)
+
+
 def orjson_dumps(
     obj: Any,
     *,
     option: Optional[int] = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
     default: Optional[Callable[[Any], Any]] = None,
 ) -> str:
-    default = default or default_timedelta
-    return orjson.dumps(obj, default=default, option=option).decode()
+    return orjson_dumps_bytes(obj, default=default, option=option).decode()
 
 
 orjson_loads = orjson.loads
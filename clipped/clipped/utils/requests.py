@@ -1,10 +1,23 @@
-from typing import Dict, Optional
+import atexit
+import threading
+
+from collections.abc import Mapping
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import requests
 except ImportError:
     raise ImportError("This module depends on requests.")
 
+from clipped.utils.workers import get_pool_workers
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = get_pool_workers()
+
+_sessions: Dict[Tuple, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
 
 def create_session(
     session: Optional[requests.Session] = None,
@@ -33,6 +46,52 @@ def create_session(
     return session
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def get_session(
+    session_attrs: Optional[Dict] = None,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+) -> requests.Session:
+    """
+    Returns a shared session, keyed by its `session_attrs` and pool sizes,
+    so that connections are kept alive and reused across requests.
+
+    Shared sessions do not store cookies to keep requests independent.
+    """
+    pool_connections = pool_connections or POOL_CONNECTIONS
+    pool_maxsize = pool_maxsize or POOL_MAXSIZE
+    key = (_freeze(session_attrs or {}), pool_connections, pool_maxsize)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = create_session(session_attrs=dict(session_attrs or {}))
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+    return session
+
+
+def close_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+atexit.register(close_sessions)
+
+
 def safe_request(
     url: str,
     method: str = None,
@@ -46,9 +105,16 @@ def safe_request(
     session: Optional[requests.Session] = None,
     session_attrs: Optional[Dict] = None,
 ) -> requests.Response:
-    """A slightly safer version of `request`."""
+    """
+    A slightly safer version of `request`.
+
+    If no session is provided, a shared session is used, see `get_session`.
+    """
 
-    session = create_session(session, session_attrs)
+    if session is None:
+        session = get_session(session_attrs)
+    else:
+        session = create_session(session, session_attrs)
 
     kwargs = {}
 
@@ -10,9 +10,9 @@ def validate_tags(
         return None
 
     if validate_yaml and isinstance(tags, str) and ("[" in tags and "]" in tags):
-        import yaml
+        from clipped.utils.yaml import safe_load
 
-        tags = yaml.safe_load(tags)
+        tags = safe_load(tags)
 
     if isinstance(tags, str):
         tags = [tag.strip() for tag in tags.split(",")]
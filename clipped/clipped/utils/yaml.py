@@ -1,14 +1,23 @@
 import yaml
 
-from typing import TextIO, Union
+from typing import Any, Iterator, TextIO, Union
 
 try:
     from yaml import CSafeDumper as _SafeDumper
     from yaml import CSafeLoader as _SafeLoader
+
+    YAML_BACKEND = "libyaml"
 except ImportError:
     from yaml import SafeDumper as _SafeDumper
     from yaml import SafeLoader as _SafeLoader
 
+    YAML_BACKEND = "python"
+
+
+def get_backend() -> str:
+    """Returns the active yaml backend, `libyaml` if the C implementation is available."""
+    return YAML_BACKEND
+
 
 def dump(data, stream=None):
     return yaml.dump(
@@ -20,5 +29,13 @@ def dump(data, stream=None):
     )
 
 
+def safe_dump(data: Any, stream=None, **kwargs):
+    return yaml.dump(data, stream=stream, Dumper=_SafeDumper, **kwargs)
+
+
 def safe_load(filepath: Union[str, TextIO]):
     return yaml.load(filepath, Loader=_SafeLoader)
+
+
+def safe_load_all(stream: Union[str, TextIO]) -> Iterator[Any]:
+    return yaml.load_all(stream, Loader=_SafeLoader)
@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+from unittest import TestCase, skipIf
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+@skipIf(pa is None, "pyarrow is not installed")
+class ArrowUtilsTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+
+    @staticmethod
+    def get_rows(num_rows: int):
+        for i in range(num_rows):
+            row = {"id": i, "name": "run-{}".format(i)}
+            if i % 2:
+                row["loss"] = i / 10
+            yield row
+
+    def test_iter_record_batches(self):
+        from clipped.utils.arrow import iter_record_batches
+
+        schema, batches = iter_record_batches(self.get_rows(25), batch_size=10)
+        assert schema.names == ["id", "name", "loss"]
+        batches = list(batches)
+        assert [b.num_rows for b in batches] == [10, 10, 5]
+        assert batches[0].column(2).to_pylist()[:2] == [None, 0.1]
+
+        schema, batches = iter_record_batches(
+            self.get_rows(25), batch_size=10, infer_schema_batches=2
+        )
+        batches = list(batches)
+        assert [b.num_rows for b in batches] == [10, 10, 5]
+        assert [i for b in batches for i in b.column(0).to_pylist()] == list(range(25))
+        assert all(b.schema == schema for b in batches)
+
+    def test_iter_record_batches_null_columns(self):
+        from clipped.utils.arrow import iter_record_batches
+
+        rows = [{"id": 1, "loss": None}, {"id": 2}, {"id": 3, "loss": 0.3}]
+        schema, batches = iter_record_batches(iter(rows), batch_size=2)
+        assert schema.field("loss").type == pa.string()
+        batches = list(batches)
+        assert all(b.schema == schema for b in batches)
+        assert [i for b in batches for i in b.column(1).to_pylist()] == [
+            None,
+            None,
+            "0.3",
+        ]
+
+    def test_write_parquet(self):
+        import pyarrow.parquet as pq
+
+        from clipped.utils.arrow import write_parquet
+
+        filename = os.path.join(self.tmp_dir, "data.parquet")
+        assert write_parquet(self.get_rows(25), filename, batch_size=10) == 25
+        table = pq.read_table(filename)
+        assert table.num_rows == 25
+        assert table.column("id").to_pylist() == list(range(25))
+
+    def test_write_arrow(self):
+        from clipped.utils.arrow import write_arrow
+
+        filename = os.path.join(self.tmp_dir, "data.arrow")
+        schema = pa.schema([("id", pa.int64()), ("loss", pa.float64())])
+        assert write_arrow(self.get_rows(5), filename, schema=schema) == 5
+        with pa.ipc.open_file(filename) as reader:
+            table = reader.read_all()
+        assert table.schema == schema
+        assert table.column("loss").to_pylist() == [None, 0.1, None, 0.3, None]
@@ -0,0 +1,69 @@
+import hashlib
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from unittest import TestCase
+
+
+class LocalHTTPServerTestCase(TestCase):
+    """
+    Serves `documents` (path -> body) from a local HTTP server, with ETags,
+    and records the requests received.
+    """
+
+    documents: Dict[str, str] = {}
+    delay: float = 0
+
+    def setUp(self):
+        super().setUp()
+        self.requests: List[Dict] = []
+        test_case = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                test_case.requests.append(
+                    {
+                        "path": self.path,
+                        "headers": dict(self.headers),
+                        "client_port": self.client_address[1],
+                    }
+                )
+                if test_case.delay:
+                    time.sleep(test_case.delay)
+                if self.path not in test_case.documents:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                body = test_case.documents[self.path].encode()
+                etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def get_url(self, path: str) -> str:
+        return "http://127.0.0.1:{}{}".format(self.server.server_address[1], path)
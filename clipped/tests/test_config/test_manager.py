@@ -3,8 +3,9 @@ import os
 from mock import patch
 from unittest import TestCase
 
-from clipped.config.contexts import get_project_path
+from clipped.config.contexts import get_project_path, get_temp_path
 from clipped.config.manager import ConfigManager
+from clipped.config.spec import ConfigSpec
 
 
 class TestBaseConfigManger(TestCase):
@@ -89,3 +90,12 @@ class TestBaseConfigManger(TestCase):
         assert path_fct1.call_args_list[0][0] == ()
         assert path_fct1.call_args_list[0][1] == {"create": False}
         assert path_fct2.call_count == 1
+
+    def test_enable_http_cache(self):
+        try:
+            cache = self.DummyConfigManger.enable_http_cache(offline=True)
+            assert ConfigSpec._HTTP_CACHE is cache
+            assert cache.path == os.path.join(get_temp_path(".foo"), "http_cache")
+            assert cache.offline is True
+        finally:
+            ConfigSpec.disable_http_cache()
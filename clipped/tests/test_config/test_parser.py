@@ -1090,3 +1090,24 @@ class TestConfigParser(TestCase):
             get_image_init(key="dict_non_existing_key", value=None, is_optional=True),
             None,
         )
+
+    def test_parse_reuses_cached_type_adapters(self):
+        ConfigParser.parse_cache_clear()
+        get_int = ConfigParser.parse(int)
+        get_int(key="int_key", value=1)
+        get_int(key="int_list_key", value=[1, 2], is_list=True)
+        info = ConfigParser.parse_cache_info()
+        assert info.misses == 2
+        assert info.hits == 0
+
+        assert ConfigParser.parse(int)(key="int_key", value="2") == 2
+        assert ConfigParser.parse(int)(
+            key="int_list_key", value=["3", 4], is_list=True
+        ) == [3, 4]
+        info = ConfigParser.parse_cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+        assert info.currsize == 2
+
+        ConfigParser.parse_cache_clear()
+        assert ConfigParser.parse_cache_info().currsize == 0
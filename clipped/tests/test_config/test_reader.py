@@ -1,11 +1,12 @@
 import os
 
+from typing import Annotated
 from unittest import TestCase
 
 from clipped import types
 from clipped.compact.pydantic import PYDANTIC_VERSION, StrictInt, StrictStr
 from clipped.config.exceptions import SchemaError
-from clipped.config.reader import ConfigReader
+from clipped.config.reader import CompiledConfigSpec, ConfigReader
 from clipped.types.lists import ListStr
 
 
@@ -611,3 +612,102 @@ class TestConfigReader(TestCase):
             ),
             ["foo"],
         )
+
+    def test_get_many(self):
+        values = self.config.get_many(
+            [
+                {"key": "bool_key_1", "key_type": "bool"},
+                {"key": "int_list_key_1", "key_type": "int", "is_list": True},
+                {"key": "float_key_2", "key_type": "float", "is_secret": True},
+                {"key": "string_key_3", "key_type": "str", "options": ["foo", "bar"]},
+                {"key": "dict_key_1", "key_type": "dict", "is_local": True},
+                {
+                    "key": "non_existing_key",
+                    "key_type": "int",
+                    "is_optional": True,
+                    "default": 12,
+                },
+            ]
+        )
+        assert values == {
+            "bool_key_1": self.config.get("bool_key_1", "bool"),
+            "int_list_key_1": self.config.get("int_list_key_1", "int", is_list=True),
+            "float_key_2": self.config.get("float_key_2", "float"),
+            "string_key_3": self.config.get("string_key_3", "str"),
+            "dict_key_1": self.config.get("dict_key_1", "dict"),
+            "non_existing_key": 12,
+        }
+        assert "float_key_2" in self.config.secret_keys
+        assert "dict_key_1" in self.config.local_keys
+        assert "non_existing_key" in self.config.requested_keys
+
+        # Dict of key specs
+        values = self.config.get_many(
+            {
+                "int_key_1": {"key_type": "int"},
+                "int_key_2": {"key_type": "int"},
+            }
+        )
+        assert values == {"int_key_1": 123, "int_key_2": 123}
+
+        with self.assertRaises(SchemaError):
+            self.config.get_many(
+                [
+                    {"key": "int_key_1", "key_type": "int"},
+                    {"key": "int_error_key_3", "key_type": "int"},
+                ]
+            )
+
+        with self.assertRaises(SchemaError):
+            self.config.get_many([{"key": "non_existing_key", "key_type": "int"}])
+
+        with self.assertRaises(SchemaError):
+            self.config.get_many(
+                [{"key": "string_key_3", "key_type": "str", "options": ["bar"]}]
+            )
+
+    def test_get_many_uses_get_value(self):
+        class PrefixedConfigReader(ConfigReader):
+            def get_value(self, key):
+                return super().get_value("PREFIX_{}".format(key))
+
+        config = PrefixedConfigReader(PREFIX_FOO="1", FOO="2")
+        assert config.get_many([{"key": "FOO", "key_type": "int"}]) == {"FOO": 1}
+        assert config.get("FOO", "int") == 1
+
+    def test_get_many_unhashable_types(self):
+        key_type = Annotated[int, {"unhashable": True}]
+        compiled_spec = CompiledConfigSpec(
+            [
+                {"key": "FOO", "key_type": key_type},
+                {"key": "BAR", "key_type": "int", "is_optional": True},
+            ]
+        )
+        assert compiled_spec.model is None
+        config = ConfigReader(FOO=1, BAR="2")
+        assert compiled_spec.apply(config) == {"FOO": 1, "BAR": 2}
+        assert config.get_many([{"key": "FOO", "key_type": key_type}]) == {"FOO": 1}
+
+        with self.assertRaises(SchemaError):
+            compiled_spec.apply(ConfigReader(FOO="foo"))
+
+    def test_compiled_config_spec(self):
+        compiled_spec = CompiledConfigSpec(
+            {
+                "int_key_1": {"key_type": "int"},
+                "string_key_3": {"key_type": "str", "options": ["foo", "bar"]},
+                "FOO_BAR_KEY": {"key_type": "str", "is_optional": True},
+            }
+        )
+        assert compiled_spec.keys[1]["options"] == frozenset(["foo", "bar"])
+        assert compiled_spec.apply(self.config) == {
+            "int_key_1": 123,
+            "string_key_3": "foo",
+            "FOO_BAR_KEY": "foo_bar",
+        }
+        assert compiled_spec.apply(
+            ConfigReader(int_key_1="12", string_key_3="bar")
+        ) == {"int_key_1": 12, "string_key_3": "bar", "FOO_BAR_KEY": None}
+
+        with self.assertRaises(SchemaError):
+            compiled_spec.apply(ConfigReader(int_key_1="12", string_key_3="baz"))
@@ -0,0 +1,57 @@
+import os
+
+from timeit import Timer
+from unittest import TestCase
+
+from clipped.config.reader import CompiledConfigSpec, ConfigReader
+
+
+class TestConfigReaderSpeed(TestCase):
+    """Compare repeated `ConfigReader.get` calls with a `CompiledConfigSpec`."""
+
+    num_keys = 500
+
+    def setUp(self):
+        super().setUp()
+        key_types = [
+            ("int", "12"),
+            ("float", "1.2"),
+            ("bool", "true"),
+            ("str", "foo"),
+            ("dict", '{"foo": "bar"}'),
+        ]
+        self.keys = []
+        data = {}
+        for i in range(self.num_keys):
+            key_type, value = key_types[i % len(key_types)]
+            key = "KEY_{}".format(i)
+            is_list = i % 7 == 0
+            data[key] = "[{}]".format(value) if is_list and key_type != "str" else value
+            self.keys.append(
+                {
+                    "key": key,
+                    "key_type": key_type,
+                    "is_list": is_list and key_type != "str",
+                    "is_optional": i % 3 == 0,
+                }
+            )
+        self.config = ConfigReader(**data)
+
+    def read_with_get(self):
+        return {spec["key"]: self.config.get(**spec) for spec in self.keys}
+
+    def test_compiled_spec_is_faster_than_repeated_get(self):
+        iterations = int(os.environ.get("CLIPPED_TEST_SPEED_ITERATIONS", "20"))
+        compiled_spec = CompiledConfigSpec(self.keys)
+        assert compiled_spec.apply(self.config) == self.read_with_get()
+
+        get_time = Timer(self.read_with_get).timeit(iterations)
+        compiled_time = Timer(lambda: compiled_spec.apply(self.config)).timeit(
+            iterations
+        )
+        self.assertTrue(
+            compiled_time < get_time,
+            "Regression in compiled config spec speed detected ({} {}).".format(
+                compiled_time, get_time
+            ),
+        )
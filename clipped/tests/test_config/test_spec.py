@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from unittest import TestCase
 
 from clipped.config.exceptions import SchemaError
@@ -98,3 +101,113 @@ class TestConfigSpec(TestCase):
         """
         config = ConfigSpec.read_from(stream)
         assert config is not None
+
+    def test_reads_json_stream_without_yaml_parsing(self):
+        assert ConfigSpec.is_json_stream('  \n{"x": 1}')
+        assert ConfigSpec.is_json_stream(b'[{"x": 1}]')
+        assert ConfigSpec.is_json_stream("x: 1", config_type=".json")
+        assert not ConfigSpec.is_json_stream("x: 1")
+        assert not ConfigSpec.is_json_stream("---\n{x: 1}")
+
+        assert ConfigSpec.read_from('\ufeff {"x": 1e3, "y": {"z": [1]}}') == {
+            "x": 1000.0,
+            "y": {"z": [1]},
+        }
+        assert ConfigSpec.read_from_stream(b'\xef\xbb\xbf{"x": 1}') == {"x": 1}
+        # Yaml flow mappings are still supported
+        assert ConfigSpec.read_from("{x: y, 1: 2}") == {"x": "y", 1: 2}
+
+    def test_reads_files_with_file_cache(self):
+        cache = ConfigSpec.enable_file_cache(max_entries=2)
+        try:
+            config = ConfigSpec.read_from("tests/fixtures/parsing/yaml_file.yml")
+            config["x"] = "mutated"
+            config = ConfigSpec.read_from("tests/fixtures/parsing/yaml_file.yml")
+            assert config == {"x": 10, "y": 20, "foo": "bar", "type": "yaml"}
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            filepath = os.path.join(tempfile.mkdtemp(), "config.json")
+            with open(filepath, "w") as f:
+                f.write('{"x": 1}')
+            assert ConfigSpec.read_from(filepath) == {"x": 1}
+            with open(filepath, "w") as f:
+                f.write('{"x": 12}')
+            os.utime(filepath, ns=(0, 0))
+            assert ConfigSpec.read_from(filepath) == {"x": 12}
+            assert (cache.hits, cache.misses) == (1, 3)
+            assert len(cache) == 2
+
+            # Evicted
+            ConfigSpec.read_from("tests/fixtures/parsing/yaml_file.yml")
+            assert (cache.hits, cache.misses) == (1, 4)
+
+            with open(filepath, "w") as f:
+                f.write('{"x": ')
+            with self.assertRaises(SchemaError) as e:
+                ConfigSpec.read_from(filepath)
+            assert filepath in str(e.exception)
+        finally:
+            ConfigSpec.disable_file_cache()
+
+    def test_iter_yaml_documents(self):
+        stream = "x: 1\ny: {a: 1}\n---\n---\ny: {b: 2}\n"
+        assert list(ConfigSpec.iter_documents(stream)) == [
+            {"x": 1, "y": {"a": 1}},
+            {"y": {"b": 2}},
+        ]
+        assert ConfigSpec.read_documents(stream) == {"x": 1, "y": {"a": 1, "b": 2}}
+
+        filepath = os.path.join(tempfile.mkdtemp(), "bundle.yaml")
+        with open(filepath, "w") as f:
+            f.write(stream)
+        assert ConfigSpec.read_documents(filepath) == {"x": 1, "y": {"a": 1, "b": 2}}
+
+        with self.assertRaises(SchemaError):
+            list(ConfigSpec.iter_documents("x: 1\n---\n- 1\n"))
+
+        with self.assertRaises(SchemaError):
+            list(ConfigSpec.iter_documents("x: 1\n---\n;sdfsd: [;sdff"))
+
+    def test_iter_json_lines_documents(self):
+        stream = '{"x": 1, "y": {"a": 1}}\n\n{"y": {"b": 2}}\n'
+        assert list(ConfigSpec.iter_documents(stream, config_type=".jsonl")) == [
+            {"x": 1, "y": {"a": 1}},
+            {"y": {"b": 2}},
+        ]
+
+        filepath = os.path.join(tempfile.mkdtemp(), "bundle.jsonl")
+        with open(filepath, "w") as f:
+            f.write(stream)
+        assert ConfigSpec.read_documents(filepath) == {"x": 1, "y": {"a": 1, "b": 2}}
+
+        with self.assertRaises(SchemaError):
+            list(ConfigSpec.iter_documents('{"x": 1}\n{"x"', config_type=".jsonl"))
+
+    def test_reads_config_map_immutable(self):
+        layer1 = {"x": {"y": 1}, "z": {"w": 1}}
+        layer2 = {"x": {"v": 2}}
+        config = ConfigSpec.read_from([layer1, layer2], immutable=True)
+        assert config == {"x": {"y": 1, "v": 2}, "z": {"w": 1}}
+        assert layer1 == {"x": {"y": 1}, "z": {"w": 1}}
+        assert config["z"] is layer1["z"]
+
+    def test_reads_config_map_provenance(self):
+        config_path = "tests/fixtures/parsing/json_file.json"
+        provenance = {}
+        config = ConfigSpec.read_from(
+            [config_path, {"x": {"y": 1}}, {"x": {"y": 2}, "foo": "baz"}],
+            provenance=provenance,
+        )
+        assert config["x"] == {"y": 2}
+        assert provenance[("x", "y")] == (2, None)
+        assert provenance[("foo",)] == (2, None)
+        assert provenance[("type",)] == (0, config_path)
+        assert ("x",) not in provenance
+
+        provenance_immutable = {}
+        ConfigSpec.read_from(
+            [config_path, {"x": {"y": 1}}, {"x": {"y": 2}, "foo": "baz"}],
+            immutable=True,
+            provenance=provenance_immutable,
+        )
+        assert provenance_immutable == provenance
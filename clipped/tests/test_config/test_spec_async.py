@@ -0,0 +1,145 @@
+import asyncio
+import certifi
+import gc
+import ssl
+import tempfile
+import time
+import warnings
+
+from unittest import IsolatedAsyncioTestCase
+
+from clipped.config.exceptions import SchemaError
+from clipped.utils.async_requests import (
+    async_safe_request,
+    create_async_session,
+    get_request_kwargs,
+    get_ssl,
+)
+from tests.test_config.base import LocalHTTPServerTestCase
+from tests.test_config.test_spec_remote import PublicHubConfigSpec
+
+
+class TestConfigSpecAsync(LocalHTTPServerTestCase, IsolatedAsyncioTestCase):
+    documents = {
+        "/layer1.json": '{"x": 1, "y": {"a": 1}}',
+        "/layer2.yaml": "y:\n  b: 2\nz: 3\n",
+        "/hub/foo/v1.yaml": "x: 10\n",
+    }
+    delay = 0.2
+
+    def setUp(self):
+        super().setUp()
+        PublicHubConfigSpec.public_hub = self.get_url("/hub")
+
+    async def test_async_safe_request(self):
+        resp = await async_safe_request(self.get_url("/layer1.json"))
+        assert resp.status == 200
+        assert await resp.text() == self.documents["/layer1.json"]
+
+        async with create_async_session() as session:
+            assert session.trust_env is True
+            for _ in range(2):
+                resp = await async_safe_request(
+                    self.get_url("/no_file.json"), session=session
+                )
+                assert resp.status == 404
+        # Connections are reused with a session
+        assert len({r["client_port"] for r in self.requests[1:]}) == 1
+        async with create_async_session({"trust_env": False}) as session:
+            assert session.trust_env is False
+
+    async def test_aread_from(self):
+        timings = []
+        start = time.monotonic()
+        config = await PublicHubConfigSpec.aread_from(
+            [
+                PublicHubConfigSpec(self.get_url("/layer1.json"), config_type="url"),
+                {"x": 2, "w": 4},
+                PublicHubConfigSpec(self.get_url("/layer2.yaml"), config_type="url"),
+                PublicHubConfigSpec("foo:v1", config_type="hub"),
+            ],
+            timings=timings,
+        )
+        duration = time.monotonic() - start
+        assert config == {"x": 10, "y": {"a": 1, "b": 2}, "z": 3, "w": 4}
+        assert duration < 3 * self.delay
+        assert len(timings) == 4
+
+    async def test_aread_from_bounded_concurrency(self):
+        start = time.monotonic()
+        config = await PublicHubConfigSpec.aread_from(
+            [self.get_url("/layer1.json"), self.get_url("/layer2.yaml")],
+            config_type="url",
+            max_concurrency=1,
+        )
+        assert config == {"x": 1, "y": {"a": 1, "b": 2}, "z": 3}
+        assert time.monotonic() - start >= 2 * self.delay
+
+    async def test_aread_from_raises_in_order(self):
+        with self.assertRaises(SchemaError):
+            await PublicHubConfigSpec.aread_from(
+                [
+                    PublicHubConfigSpec(
+                        self.get_url("/layer1.json"), config_type="url"
+                    ),
+                    PublicHubConfigSpec("bar:v1", config_type="hub"),
+                ]
+            )
+
+    async def test_async_safe_request_timeout(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await async_safe_request(self.get_url("/layer1.json"), timeout=0.05)
+
+    async def test_aread_from_with_http_cache(self):
+        PublicHubConfigSpec.enable_http_cache(path=tempfile.mkdtemp())
+        try:
+            for _ in range(2):
+                config = await PublicHubConfigSpec.aread_from(
+                    [
+                        PublicHubConfigSpec(
+                            self.get_url("/layer1.json"), config_type="url"
+                        ),
+                        PublicHubConfigSpec("foo:v1", config_type="hub"),
+                    ]
+                )
+                assert config == {"x": 10, "y": {"a": 1}}
+        finally:
+            PublicHubConfigSpec.disable_http_cache()
+        assert len(self.requests) == 3
+        assert self.requests[2]["headers"]["If-None-Match"]
+
+
+class TestAsyncRequestsSessions(LocalHTTPServerTestCase):
+    documents = {"/layer1.json": '{"x": 1}'}
+
+    def test_sessions_are_closed_with_the_event_loop(self):
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter("always")
+            for _ in range(3):
+                resp = asyncio.run(async_safe_request(self.get_url("/layer1.json")))
+                assert resp.status == 200
+                config = asyncio.run(
+                    PublicHubConfigSpec.aread_from(
+                        self.get_url("/layer1.json"), config_type="url"
+                    )
+                )
+                assert config == {"x": 1}
+            gc.collect()
+        assert not [r for r in records if issubclass(r.category, ResourceWarning)]
+
+    def test_session_attrs(self):
+        url = self.get_url("/layer1.json")
+        assert get_request_kwargs(url) == {}
+        assert get_request_kwargs(url, {"verify": False}) == {"ssl": False}
+        assert get_request_kwargs(
+            url, {"proxies": {"http": "http://proxy"}, "max_redirects": 2}
+        ) == {"proxy": "http://proxy", "max_redirects": 2}
+        with self.assertRaises(ValueError):
+            get_request_kwargs(url, {"stream": True})
+
+        # CA bundles and client certificates are loaded in an ssl context
+        context = get_ssl(certifi.where())
+        assert isinstance(context, ssl.SSLContext)
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        with self.assertRaises(OSError):
+            get_ssl(True, cert="/tmp/no_cert.pem")
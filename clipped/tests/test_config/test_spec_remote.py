@@ -0,0 +1,153 @@
+import tempfile
+import time
+
+from clipped.config.exceptions import SchemaError
+from clipped.config.spec import ConfigSpec
+from tests.test_config.base import LocalHTTPServerTestCase
+
+
+class PublicHubConfigSpec(ConfigSpec):
+    public_hub = None
+
+    @classmethod
+    def get_public_registry(cls) -> str:
+        return cls.public_hub
+
+
+class TestConfigSpecRemote(LocalHTTPServerTestCase):
+    documents = {
+        "/layer1.json": '{"x": 1, "y": {"a": 1}}',
+        "/layer2.yaml": "y:\n  b: 2\nz: 3\n",
+        "/hub/foo/v1.yaml": "x: 10\n",
+    }
+    delay = 0.2
+
+    def setUp(self):
+        super().setUp()
+        PublicHubConfigSpec.public_hub = self.get_url("/hub")
+
+    def test_read_from_urls(self):
+        config = ConfigSpec.read_from(
+            [self.get_url("/layer1.json"), self.get_url("/layer2.yaml")],
+            config_type="url",
+        )
+        assert config == {"x": 1, "y": {"a": 1, "b": 2}, "z": 3}
+
+    def test_read_from_remote_values_concurrently(self):
+        timings = []
+        config_values = [
+            PublicHubConfigSpec(self.get_url("/layer1.json"), config_type="url"),
+            {"x": 2, "w": 4},
+            PublicHubConfigSpec(self.get_url("/layer2.yaml"), config_type="url"),
+            PublicHubConfigSpec("foo:v1", config_type="hub"),
+        ]
+        states = [dict(v.__dict__) for v in config_values if isinstance(v, ConfigSpec)]
+        start = time.monotonic()
+        config = PublicHubConfigSpec.read_from(
+            config_values, concurrent=True, timings=timings
+        )
+        duration = time.monotonic() - start
+        assert config == {"x": 10, "y": {"a": 1, "b": 2}, "z": 3, "w": 4}
+        assert duration < 3 * self.delay
+        assert len(self.requests) == 3
+        assert [t[0] for t in timings] == [
+            self.get_url("/layer1.json"),
+            {"x": 2, "w": 4},
+            self.get_url("/layer2.yaml"),
+            "foo:v1",
+        ]
+        assert all(t[1] >= self.delay for t in timings if t[0] != {"x": 2, "w": 4})
+        # The timings are returned, the config specs are not modified
+        assert states == [
+            v.__dict__ for v in config_values if isinstance(v, ConfigSpec)
+        ]
+
+    def test_read_from_remote_values_concurrently_raises_in_order(self):
+        with self.assertRaises(SchemaError):
+            PublicHubConfigSpec.read_from(
+                [
+                    PublicHubConfigSpec(
+                        self.get_url("/layer1.json"), config_type="url"
+                    ),
+                    PublicHubConfigSpec("bar:v1", config_type="hub"),
+                ],
+                concurrent=True,
+            )
+
+
+class TestConfigSpecHttpCache(LocalHTTPServerTestCase):
+    documents = {
+        "/layer1.json": '{"x": 1}',
+        "/hub/foo/v1.yaml": "x: 10\n",
+        "/hub/foo/latest.yaml": "x: 11\n",
+    }
+
+    def setUp(self):
+        super().setUp()
+        PublicHubConfigSpec.public_hub = self.get_url("/hub")
+        self.cache = PublicHubConfigSpec.enable_http_cache(path=tempfile.mkdtemp())
+
+    def tearDown(self):
+        PublicHubConfigSpec.disable_http_cache()
+        super().tearDown()
+
+    def test_conditional_requests(self):
+        url = self.get_url("/layer1.json")
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 1}
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 1}
+        assert len(self.requests) == 2
+        assert "If-None-Match" not in self.requests[0]["headers"]
+        assert self.requests[1]["headers"]["If-None-Match"]
+
+        # Changed document
+        self.documents = dict(self.documents, **{"/layer1.json": '{"x": 2}'})
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 2}
+
+        # Offline mode
+        self.cache.offline = True
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 2}
+        assert len(self.requests) == 3
+        with self.assertRaises(SchemaError):
+            PublicHubConfigSpec.read_from(
+                self.get_url("/layer2.json"), config_type="url"
+            )
+
+    def test_serves_cache_when_unreachable(self):
+        url = self.get_url("/layer1.json")
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 1}
+        self.server.shutdown()
+        self.server.server_close()
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 1}
+
+    def test_versioned_hub_components_are_immutable(self):
+        for _ in range(3):
+            assert PublicHubConfigSpec.read_from("foo:v1", config_type="hub") == {
+                "x": 10
+            }
+            assert PublicHubConfigSpec.read_from("foo", config_type="hub") == {"x": 11}
+        assert [r["path"] for r in self.requests] == [
+            "/hub/foo/v1.yaml",
+            "/hub/foo/latest.yaml",
+            "/hub/foo/latest.yaml",
+            "/hub/foo/latest.yaml",
+        ]
+
+    def test_stale_while_revalidate(self):
+        url = self.get_url("/layer1.json")
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 1}
+        self.documents = dict(self.documents, **{"/layer1.json": '{"x": 2}'})
+        self.delay = 0.2
+        self.cache.stale_while_revalidate = True
+
+        # Stale documents are served, and revalidated once at a time
+        for _ in range(5):
+            assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 1}
+        entry, _ = self.cache.lookup(url)
+        revalidation = self.cache.schedule_revalidation(url, entry)
+        revalidation.result()
+        assert len(self.requests) == 2
+        assert not self.cache._revalidations
+
+        self.cache.stale_while_revalidate = False
+        self.delay = 0
+        assert PublicHubConfigSpec.read_from(url, config_type="url") == {"x": 2}
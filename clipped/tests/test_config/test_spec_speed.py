@@ -0,0 +1,58 @@
+import os
+
+from timeit import Timer
+from unittest import TestCase
+
+from clipped.config.spec import ConfigSpec
+from clipped.utils.json import orjson_dumps
+from clipped.utils.yaml import safe_dump, safe_load
+
+
+class TestConfigSpecSpeed(TestCase):
+    """Compare reading ~1MB json and yaml payloads with and without sniffing."""
+
+    def setUp(self):
+        super().setUp()
+        value = {
+            "component_{}".format(i): {
+                "name": "foo-{}".format(i),
+                "tags": ["a", "b", "c"],
+                "params": {"lr": 0.01 * i, "steps": i, "enabled": i % 2 == 0},
+            }
+            for i in range(10000)
+        }
+        self.value = value
+        self.json_payload = orjson_dumps(value)
+        self.yaml_payload = safe_dump(value)
+        assert len(self.json_payload) > 1024 * 1024
+        assert len(self.yaml_payload) > 1024 * 1024
+
+    def test_json_stream_skips_yaml_parsing(self):
+        iterations = int(os.environ.get("CLIPPED_TEST_SPEED_ITERATIONS", "1"))
+        assert ConfigSpec.read_from_stream(self.json_payload) == self.value
+
+        sniffed_time = Timer(
+            lambda: ConfigSpec.read_from_stream(self.json_payload)
+        ).timeit(iterations)
+        yaml_time = Timer(lambda: safe_load(self.json_payload)).timeit(iterations)
+        self.assertTrue(
+            sniffed_time < yaml_time,
+            "Regression in json stream reading speed detected ({} {}).".format(
+                sniffed_time, yaml_time
+            ),
+        )
+
+    def test_yaml_stream_sniffing_overhead(self):
+        iterations = int(os.environ.get("CLIPPED_TEST_SPEED_ITERATIONS", "1"))
+        sniff_time = Timer(lambda: ConfigSpec.is_json_stream(self.yaml_payload)).timeit(
+            iterations
+        )
+        yaml_time = Timer(
+            lambda: ConfigSpec.read_from_stream(self.yaml_payload)
+        ).timeit(iterations)
+        self.assertTrue(
+            sniff_time < yaml_time / 100,
+            "Regression in yaml stream sniffing speed detected ({} {}).".format(
+                sniff_time, yaml_time
+            ),
+        )
@@ -0,0 +1,65 @@
+import csv
+import gzip
+import os
+import tempfile
+
+from unittest import TestCase
+
+from clipped.utils.csv import write_csv, write_csv_stream
+
+
+class CsvUtilsTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def test_write_csv(self):
+        filename = os.path.join(self.tmp_dir, "data.csv")
+        write_csv([{"a": 1, "b": 2}, {"a": 3, "c": 4}], filename)
+        with open(filename) as f:
+            assert list(csv.DictReader(f)) == [
+                {"a": "1", "b": "2", "c": ""},
+                {"a": "3", "b": "", "c": "4"},
+            ]
+
+    def test_write_csv_stream_chunks(self):
+        filename = os.path.join(self.tmp_dir, "data.csv")
+        rows = ({"id": i, "value": i * 2} for i in range(25))
+        assert write_csv_stream(rows, filename, chunk_size=10) == 25
+        with open(filename) as f:
+            results = list(csv.DictReader(f))
+        assert len(results) == 25
+        assert results[-1] == {"id": "24", "value": "48"}
+
+    def test_write_csv_stream_extra_keys(self):
+        filename = os.path.join(self.tmp_dir, "data.csv")
+        rows = [{"a": 1}, {"a": 2, "b": 3}, {"a": 4, "b": 5}]
+        with self.assertLogs("clipped.utils.csv", level="WARNING") as logs:
+            assert write_csv_stream(iter(rows), filename, chunk_size=1) == 3
+        assert len(logs.output) == 1
+        assert "['b']" in logs.output[0]
+        with open(filename) as f:
+            assert f.read().splitlines() == ["a", "1", "2", "4"]
+
+        with self.assertRaises(ValueError):
+            write_csv_stream(iter(rows), filename, chunk_size=1, extrasaction="raise")
+
+        write_csv_stream(iter(rows), filename, fieldnames=["b", "a"])
+        with open(filename) as f:
+            assert f.read().splitlines() == ["b,a", ",1", "3,2", "5,4"]
+
+    def test_write_tsv_gzip(self):
+        filename = os.path.join(self.tmp_dir, "data.tsv.gz")
+        assert write_csv_stream([{"a": 1, "b": "foo"}], filename) == 1
+        with gzip.open(filename, "rt") as f:
+            assert f.read().splitlines() == ["a\tb", "1\tfoo"]
+
+    def test_write_csv_stream_empty(self):
+        filename = os.path.join(self.tmp_dir, "data.csv")
+        assert write_csv_stream(iter([]), filename) == 0
+        with open(filename) as f:
+            assert f.read() == ""
+
+        assert write_csv_stream(iter([]), filename, fieldnames=["a"]) == 0
+        with open(filename) as f:
+            assert f.read().splitlines() == ["a"]
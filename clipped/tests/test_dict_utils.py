@@ -0,0 +1,214 @@
+from unittest import TestCase, skipIf
+
+from clipped.config.patch_strategy import PatchStrategy
+from clipped.utils.dicts import (
+    deep_merge,
+    deep_update,
+    flatten_keys,
+    flatten_keys_to_columns,
+    flatten_keys_to_dataframe,
+    get_provenance,
+    iter_dicts_to_csv,
+    iter_dicts_to_tabulate,
+    list_dicts_to_csv,
+    list_dicts_to_tabulate,
+)
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+class DictUtilsTest(TestCase):
+    def test_deep_update(self):
+        config = {"a": 1, "b": {"c": 1, "d": {"e": 1}}, "f": [1]}
+        result = deep_update(config, {"b": {"d": {"g": 2}}, "f": [2], "h": {"i": 3}})
+        assert result == {
+            "a": 1,
+            "b": {"c": 1, "d": {"e": 1, "g": 2}},
+            "f": [2],
+            "h": {"i": 3},
+        }
+        assert result is config
+
+    def test_deep_merge_does_not_mutate_inputs(self):
+        config = {"a": 1, "b": {"c": 1, "d": {"e": 1}}, "x": {"y": 1}}
+        override_config = {"b": {"d": {"g": 2}}, "f": [2], "h": {"i": 3}}
+        result = deep_merge(config, override_config)
+        assert result == {
+            "a": 1,
+            "b": {"c": 1, "d": {"e": 1, "g": 2}},
+            "f": [2],
+            "h": {"i": 3},
+            "x": {"y": 1},
+        }
+        assert config == {"a": 1, "b": {"c": 1, "d": {"e": 1}}, "x": {"y": 1}}
+        assert override_config == {"b": {"d": {"g": 2}}, "f": [2], "h": {"i": 3}}
+
+        # Untouched subtrees are shared
+        assert result["x"] is config["x"]
+        assert result["h"] is override_config["h"]
+        assert result["b"] is not config["b"]
+
+    def test_deep_merge_layers(self):
+        layers = [
+            {"a": {"b": i, "c": {"d": i}}, "layer_{}".format(i): {}} for i in range(10)
+        ]
+        result = {}
+        for layer in layers:
+            result = deep_merge(result, layer)
+        assert result["a"] == {"b": 9, "c": {"d": 9}}
+        assert all(layers[i]["a"]["b"] == i for i in range(10))
+        assert len(result) == 11
+
+    def test_deep_update_provenance(self):
+        provenance = {}
+        config = deep_update({}, {"a": {"b": 1, "c": [1]}, "d": {}}, provenance, "s0")
+        config = deep_update(config, {"a": {"b": 2}, "e": 1}, provenance, "s1")
+        assert provenance == {
+            ("a", "b"): "s1",
+            ("a", "c"): "s0",
+            ("d",): "s0",
+            ("e",): "s1",
+        }
+
+        # Replacing a subtree drops the provenance of its previous keys
+        config = deep_update(config, {"a": 3}, provenance, "s2")
+        assert config["a"] == 3
+        assert provenance == {("a",): "s2", ("d",): "s0", ("e",): "s1"}
+        config = deep_update(config, {"e": {"f": 1}}, provenance, "s3")
+        assert provenance == {("a",): "s2", ("d",): "s0", ("e", "f"): "s3"}
+
+    def test_deep_merge_provenance(self):
+        provenance = {}
+        config = deep_merge({}, {"a": {"b": 1, "c": [1]}}, provenance, "s0")
+        config = deep_merge(config, {"a": {"b": 2}, "e": 1}, provenance, "s1")
+        assert provenance == {("a", "b"): "s1", ("a", "c"): "s0", ("e",): "s1"}
+        assert get_provenance(provenance, "a.b") == "s1"
+        assert get_provenance(provenance, ("a", "c")) == "s0"
+        assert get_provenance(provenance, "a.c.0") == "s0"
+        assert get_provenance(provenance, "x") is None
+
+    def test_deep_update_list_strategy(self):
+        def get_config():
+            return {"a": {"l": [1, 2]}, "b": [1]}
+
+        override_config = {"a": {"l": [2, 3]}, "c": [4]}
+        assert deep_update(get_config(), override_config) == {
+            "a": {"l": [2, 3]},
+            "b": [1],
+            "c": [4],
+        }
+        assert deep_update(
+            get_config(), override_config, list_strategy=PatchStrategy.POST_MERGE
+        ) == {"a": {"l": [1, 2, 3]}, "b": [1], "c": [4]}
+        assert deep_update(
+            get_config(), override_config, list_strategy=PatchStrategy.PRE_MERGE
+        ) == {"a": {"l": [2, 3, 1]}, "b": [1], "c": [4]}
+        assert deep_update(
+            get_config(), override_config, list_strategy=PatchStrategy.ISNULL
+        ) == {"a": {"l": [1, 2]}, "b": [1], "c": [4]}
+        assert deep_merge(
+            get_config(), override_config, list_strategy=PatchStrategy.POST_MERGE
+        ) == {"a": {"l": [1, 2, 3]}, "b": [1], "c": [4]}
+
+    def get_objects(self):
+        return [
+            {"uuid": 1, "metrics": {"loss": 0.1, "accuracy": 0.9}, "params": {"lr": 1}},
+            {"uuid": 2, "metrics": None, "params": {"lr": 2, "dropout": 0.2}},
+            {"uuid": 3, "metrics": {"loss": 0.3}},
+        ]
+
+    def test_flatten_keys(self):
+        objects, prefixed_columns = flatten_keys(
+            self.get_objects(),
+            columns=["metrics", "params"],
+            columns_prefix={"metrics": "metrics"},
+        )
+        assert objects == [
+            {
+                "uuid": 1,
+                "metrics.loss": 0.1,
+                "metrics.accuracy": 0.9,
+                "lr": 1,
+                "dropout": None,
+            },
+            {
+                "uuid": 2,
+                "metrics.loss": None,
+                "metrics.accuracy": None,
+                "lr": 2,
+                "dropout": 0.2,
+            },
+            {
+                "uuid": 3,
+                "metrics.loss": 0.3,
+                "metrics.accuracy": None,
+                "lr": None,
+                "dropout": None,
+            },
+        ]
+        assert prefixed_columns == {
+            "loss": "metrics.loss",
+            "accuracy": "metrics.accuracy",
+        }
+
+    def test_flatten_keys_to_columns(self):
+        objects = self.get_objects()
+        data, prefixed_columns = flatten_keys_to_columns(
+            objects,
+            columns=["metrics", "params"],
+            columns_prefix={"metrics": "metrics"},
+        )
+        assert data == {
+            "uuid": [1, 2, 3],
+            "metrics.loss": [0.1, None, 0.3],
+            "metrics.accuracy": [0.9, None, None],
+            "lr": [1, 2, None],
+            "dropout": [None, 0.2, None],
+        }
+        assert prefixed_columns == {
+            "loss": "metrics.loss",
+            "accuracy": "metrics.accuracy",
+        }
+        # The objects are not modified
+        assert objects == self.get_objects()
+
+    @skipIf(pd is None, "pandas is not installed")
+    def test_flatten_keys_to_dataframe(self):
+        df, _ = flatten_keys_to_dataframe(
+            self.get_objects(), columns=["metrics", "params"]
+        )
+        assert list(df.columns) == ["uuid", "loss", "accuracy", "lr", "dropout"]
+        assert len(df) == 3
+
+    def test_iter_dicts_to_csv(self):
+        def iter_pages():
+            for page in range(3):
+                for i in range(2):
+                    yield {"id": page * 2 + i, "name": "foo", "extra": None}
+
+        rows = iter_dicts_to_csv(iter_pages(), exclude_attrs=["extra"])
+        assert next(rows) == {"id": 0, "name": "foo"}
+        assert len(list(rows)) == 5
+        assert list(iter_dicts_to_csv(iter_pages(), include_attrs=["id"]))[-1] == {
+            "id": 5
+        }
+        assert list_dicts_to_csv(
+            list(iter_pages()), exclude_attrs=["extra"], include_attrs=["extra"]
+        )[0] == {"extra": None}
+
+    def test_iter_dicts_to_tabulate(self):
+        rows = iter_dicts_to_tabulate(
+            iter([{"id": 1, "name": "foo", "extra": None}]),
+            exclude_attrs=("extra",),
+            humanize_values=False,
+        )
+        assert list(rows) == [{"ID": 1, "NAME": "foo"}]
+        assert list_dicts_to_tabulate(
+            [{"id": 1, "name": "foo"}],
+            include_attrs=["name"],
+            humanize_values=False,
+            upper_keys=False,
+        ) == [{"name": "foo"}]
@@ -0,0 +1,106 @@
+import os
+import statistics
+import sys
+
+from functools import partial
+from timeit import Timer
+from unittest import TestCase
+
+from clipped.utils.dicts import deep_merge, deep_update
+
+
+def recursive_deep_update(config, override_config):
+    for k, v in override_config.items():
+        if isinstance(v, dict):
+            k_config = config.get(k, {})
+            if isinstance(k_config, dict):
+                config[k] = recursive_deep_update(k_config, v)
+            else:
+                config[k] = v
+        else:
+            config[k] = v
+    return config
+
+
+def get_wide_dict(num_keys: int, value: int):
+    return {
+        "key_{}".format(i): {"value": value, "nested": {"value": value, "items": [i]}}
+        for i in range(num_keys)
+    }
+
+
+def get_deep_dict(depth: int, value: int):
+    config = {"value": value}
+    for i in range(depth):
+        config = {"level_{}".format(i): config, "value": value}
+    return config
+
+
+def get_deep_values(config: dict, depth: int):
+    values = []
+    for i in reversed(range(depth)):
+        values.append(config["value"])
+        config = config["level_{}".format(i)]
+    values.append(config["value"])
+    return values
+
+
+class TestDeepUpdateSpeed(TestCase):
+    """Benchmark `deep_update` with wide (10k keys) and deep (1k levels) inputs."""
+
+    num_keys = 10000
+    depth = 1000
+
+    def test_wide_deep_update(self):
+        iterations = int(os.environ.get("CLIPPED_TEST_SPEED_ITERATIONS", "5"))
+        override_config = get_wide_dict(self.num_keys, 2)
+        assert deep_update(
+            get_wide_dict(self.num_keys, 1), override_config
+        ) == recursive_deep_update(get_wide_dict(self.num_keys, 1), override_config)
+
+        # Interleave the runs, alternating which one goes first, and keep the best
+        # of each run per round, the median ratio over a fixed number of rounds
+        # must stay within 25%, the generic path without the fast path is 2x slower
+        ratios = []
+        for _ in range(iterations):
+            times = {deep_update: [], recursive_deep_update: []}
+            for i in range(10):
+                functions = list(times) if i % 2 else list(reversed(times))
+                for function in functions:
+                    config = get_wide_dict(self.num_keys, 1)
+                    times[function].append(
+                        Timer(partial(function, config, override_config)).timeit(1)
+                    )
+            ratios.append(min(times[deep_update]) / min(times[recursive_deep_update]))
+        self.assertTrue(
+            statistics.median(ratios) <= 1.25,
+            "Regression in deep_update speed detected ({}).".format(ratios),
+        )
+
+    def test_deep_deep_update(self):
+        iterations = int(os.environ.get("CLIPPED_TEST_SPEED_ITERATIONS", "5"))
+        override_config = get_deep_dict(self.depth, 2)
+        # The limit is set explicitly, the default one depends on the environment
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(self.depth // 2)
+        try:
+            with self.assertRaises(RecursionError):
+                recursive_deep_update(get_deep_dict(self.depth, 1), override_config)
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+
+        config = deep_update(get_deep_dict(self.depth, 1), override_config)
+        assert get_deep_values(config, self.depth) == [2] * (self.depth + 1)
+        original_config = get_deep_dict(self.depth, 1)
+        config = deep_merge(original_config, override_config)
+        assert get_deep_values(config, self.depth) == [2] * (self.depth + 1)
+        assert get_deep_values(original_config, self.depth) == [1] * (self.depth + 1)
+
+        configs = [get_deep_dict(self.depth, 1) for _ in range(iterations)]
+        duration = Timer(lambda: deep_update(configs.pop(), override_config)).timeit(
+            iterations
+        )
+        self.assertTrue(
+            duration / iterations < 0.1,
+            "Regression in deep_update speed detected ({}).".format(duration),
+        )
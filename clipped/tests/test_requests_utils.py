@@ -0,0 +1,33 @@
+from clipped.utils.requests import close_sessions, get_session, safe_request
+from tests.test_config.base import LocalHTTPServerTestCase
+
+
+class RequestsUtilsTest(LocalHTTPServerTestCase):
+    documents = {"/foo": "bar"}
+
+    def tearDown(self):
+        close_sessions()
+        super().tearDown()
+
+    def test_get_session(self):
+        session = get_session()
+        assert get_session() is session
+        assert get_session({"verify": False}) is not session
+        assert get_session({"verify": False}) is get_session({"verify": False})
+        assert get_session(pool_maxsize=2) is not session
+        proxies = {"http": "http://localhost:1234"}
+        assert get_session({"proxies": proxies}).proxies == proxies
+        assert get_session({"proxies": proxies}) is get_session(
+            {"proxies": dict(proxies)}
+        )
+
+        close_sessions()
+        assert get_session() is not session
+
+    def test_safe_request_reuses_connections(self):
+        for _ in range(3):
+            resp = safe_request(self.get_url("/foo"))
+            assert resp.status_code == 200
+            assert resp.text == "bar"
+        assert len({r["client_port"] for r in self.requests}) == 1
+        assert safe_request(self.get_url("/bar")).status_code == 404
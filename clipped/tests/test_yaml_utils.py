@@ -0,0 +1,17 @@
+import yaml
+
+from unittest import TestCase
+
+from clipped.utils.yaml import get_backend, safe_dump, safe_load
+
+
+class YamlUtilsTest(TestCase):
+    def test_backend(self):
+        expected = "libyaml" if yaml.__with_libyaml__ else "python"
+        assert get_backend() == expected
+
+    def test_safe_dump_and_load(self):
+        value = {"b": [1, 2, {"x": "foo", "y": None}], "a": {"m": "multi\nline"}}
+        dumped = safe_dump(value, sort_keys=True, indent=2)
+        assert dumped == yaml.safe_dump(value, sort_keys=True, indent=2)
+        assert safe_load(dumped) == value